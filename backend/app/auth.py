@@ -1,11 +1,14 @@
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, NamedTuple
+import threading
+from cachetools import TTLCache
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from passlib.context import CryptContext
 from jose import JWTError, jwt
+from sqlalchemy import event
 from sqlalchemy.orm import Session
-from .models import User
+from .models import User, HouseholdUser
 from .database import get_db
 from .config import settings
 
@@ -14,12 +17,41 @@ SECRET_KEY = settings.secret_key
 ALGORITHM = settings.algorithm
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing: argon2id (argon2-cffi, OWASP parameters) for new hashes;
+# existing bcrypt hashes still verify and are upgraded on next login
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=1,
+    argon2__memory_cost=47104,
+    argon2__parallelism=1
+)
 
 # JWT bearer token
 security = HTTPBearer()
 
+class UserContext(NamedTuple):
+    """Lightweight, session-independent snapshot of the authenticated user."""
+    id: int
+    name: str
+    email: str
+    created_at: datetime
+
+# Short-lived user_id -> UserContext cache so authenticated requests skip the
+# users SELECT. ORM updates/deletes in this process evict the entry at once;
+# other worker processes may serve the old snapshot until the TTL expires.
+_user_cache = TTLCache(maxsize=10_000, ttl=60)
+_user_cache_lock = threading.Lock()
+
+def evict_cached_user(_mapper, _connection, target) -> None:
+    """Drop a user's cached UserContext after the row is updated or deleted."""
+    with _user_cache_lock:
+        _user_cache.pop(target.id, None)
+
+for _event_name in ("after_update", "after_delete"):
+    event.listen(User, _event_name, evict_cached_user)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
     return pwd_context.verify(plain_password, hashed_password)
@@ -60,21 +92,50 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-def get_current_user(user_id: int = Depends(verify_token), db: Session = Depends(get_db)) -> User:
-    """Get the current authenticated user."""
+def get_current_user(user_id: int = Depends(verify_token), db: Session = Depends(get_db)) -> UserContext:
+    """Get the current authenticated user (cached for a short TTL)."""
+    with _user_cache_lock:
+        cached = _user_cache.get(user_id)
+    if cached is not None:
+        return cached
+    
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
-    return user
+    
+    user_ctx = UserContext(id=user.id, name=user.name, email=user.email, created_at=user.created_at)
+    with _user_cache_lock:
+        _user_cache[user_id] = user_ctx
+    return user_ctx
 
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     """Authenticate a user by email and password."""
     user = db.query(User).filter(User.email == email).first()
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+    verified, new_hash = pwd_context.verify_and_update(password, user.password_hash)
+    if not verified:
         return None
-    return user
\ No newline at end of file
+    if new_hash:
+        # Transparently migrate legacy bcrypt hashes to argon2id
+        user.password_hash = new_hash
+        db.commit()
+    return user
+
+def user_household_id(db: Session, user_id: int) -> Optional[int]:
+    """Return the id of the user's household (or None) selecting only that column."""
+    return db.query(HouseholdUser.household_id).filter(
+        HouseholdUser.user_id == user_id
+    ).limit(1).scalar()
+
+def user_in_household(db: Session, user_id: int, household_id: int) -> bool:
+    """Check household membership with a single SELECT EXISTS (no ORM hydration)."""
+    return db.query(
+        db.query(HouseholdUser).filter(
+            HouseholdUser.household_id == household_id,
+            HouseholdUser.user_id == user_id
+        ).exists()
+    ).scalar()
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+Process-local caches for small, rarely mutated reference data.
+
+Categories are joined into nearly every transaction listing, so their
+id -> name map is kept in memory instead of being re-selected per row.
+Staleness across workers is bounded by the TTL; writes made through the
+ORM in this process invalidate immediately.
+"""
+
+import threading
+from typing import Dict, Iterable
+from cachetools import TTLCache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from .models import Category
+
+# Single-entry cache holding the full category_id -> name map
+_category_names = TTLCache(maxsize=1, ttl=300)
+_category_names_lock = threading.Lock()
+
+def invalidate_category_names(*_args) -> None:
+    """Drop the cached category name map."""
+    with _category_names_lock:
+        _category_names.clear()
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(Category, _event_name, invalidate_category_names)
+
+def get_category_names(db: Session, category_ids: Iterable[int] = ()) -> Dict[int, str]:
+    """Return the cached category_id -> name map, reloading it if any requested id is missing."""
+    with _category_names_lock:
+        names = _category_names.get("names")
+
+    if names is not None and all(cid in names for cid in category_ids if cid):
+        return names
+
+    names = dict(db.query(Category.id, Category.name).all())
+    with _category_names_lock:
+        _category_names["names"] = names
+    return names
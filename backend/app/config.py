@@ -1,6 +1,6 @@
 """Application configuration."""
 import os
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 from pydantic import BaseSettings
 
 
@@ -15,13 +15,15 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
     algorithm: str = "HS256"
     
-    # CORS
-    cors_origins: List[str] = ["http://localhost:3000", "http://127.0.0.1:3000", "http://localhost:5173", "http://127.0.0.1:5173", "http://localhost:5174", "http://127.0.0.1:5174"]
+    # CORS (a frozenset, so CORSMiddleware's per-request origin check is an O(1) lookup)
+    cors_origins: FrozenSet[str] = frozenset({"http://localhost:3000", "http://127.0.0.1:3000", "http://localhost:5173", "http://127.0.0.1:5173", "http://localhost:5174", "http://127.0.0.1:5174"})
     
     # File Upload
     max_file_size: int = 10 * 1024 * 1024  # 10MB
     allowed_file_types: List[str] = ["pdf", "csv", "xlsx", "xls"]
     upload_directory: str = "./uploads"
+    pdf_text_backend: str = "pymupdf"  # pymupdf (text + tables), pdfium (text only) or pdfplumber
+    parse_workers: int = 2  # Statement-parsing processes per API worker process
     
     # Rate Limiting
     rate_limit_storage: Optional[str] = None
@@ -44,6 +46,7 @@ class Settings(BaseSettings):
     # Environment
     environment: str = "development"
     debug: bool = True
+    raiseload_by_default: bool = False  # Raise on any unplanned lazy load (N+1 detection in dev/tests)
     
     class Config:
         env_file = ".env"
@@ -1,15 +1,92 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import os
+from contextlib import contextmanager
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.orm import sessionmaker, raiseload
+from sqlalchemy.pool import QueuePool
 from .models import Base
+from .config import settings
 
-# Database URL - using SQLite for development
-DATABASE_URL = "sqlite:///./dev.db"
+# Database URL - single source of truth shared by every importer of this module
+DATABASE_URL = settings.database_url
 
-# Create engine
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# psycopg2 executemany tuning: packs bulk INSERTs (parsed statements) into
+# multi-row VALUES pages instead of one round-trip per row
+POSTGRES_ENGINE_OPTIONS = {
+    "executemany_mode": "values_plus_batch",
+    "executemany_values_page_size": 1000,
+    "executemany_batch_page_size": 500,
+}
+
+# Create engine with a persistent connection pool so connections (and the
+# SQLite WAL/SHM mappings) are reused across requests instead of reopened, and
+# a larger compiled-statement LRU so the hot parameterized queries are compiled
+# once per process
+engine = create_engine(
+    DATABASE_URL,
+    future=True,
+    query_cache_size=1200,
+    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {},
+    poolclass=QueuePool,
+    pool_size=5,
+    max_overflow=10,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+    **(POSTGRES_ENGINE_OPTIONS if DATABASE_URL.startswith(("postgresql", "postgres")) else {})
+)
+
+def configure_sqlite(dbapi_connection):
+    """Apply SQLite PRAGMAs (WAL journal, relaxed fsync, in-memory temp) to a DB-API connection.
+
+    Shared by the engine's connect hook and any raw ``sqlite3`` connection,
+    e.g. one-off migration scripts running DDL inside ``BEGIN IMMEDIATE``.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64MB page cache
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB memory-mapped I/O
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Apply per-connection SQLite PRAGMAs."""
+        configure_sqlite(dbapi_connection)
 
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, future=True)
+
+if settings.raiseload_by_default:
+    @event.listens_for(SessionLocal, "do_orm_execute")
+    def apply_default_raiseload(orm_execute_state):
+        """Turn accidental lazy loads into errors; opt out with execution_options(unsafe_lazy=True)."""
+        if (
+            orm_execute_state.is_select
+            and not orm_execute_state.is_column_load
+            and not orm_execute_state.is_relationship_load
+            and not orm_execute_state.execution_options.get("unsafe_lazy", False)
+        ):
+            orm_execute_state.statement = orm_execute_state.statement.options(
+                raiseload("*", sql_only=True)
+            )
+
+@contextmanager
+def count_queries():
+    """Collect the SQL statements executed on the engine inside the block."""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
 
 def get_db():
     """Database dependency for FastAPI."""
@@ -17,8 +94,41 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
+        db.close()  # Returns the connection to the pool
+
+def commit_instance(db, instance, **changes):
+    """Apply column changes to an ORM instance, commit, and reload it.
+
+    The reload leaves no expired attributes behind, so an async handler can
+    call this through run_in_threadpool and then read the instance on the
+    event loop without triggering lazy SQL there.
+    """
+    for name, value in changes.items():
+        setattr(instance, name, value)
+    db.add(instance)
+    db.commit()
+    db.refresh(instance)
+    return instance
+
+# Alembic scripts (backend/migrations); see alembic.ini for the CLI
+MIGRATIONS_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+
+def stamp_schema_head(conn):
+    """Record the latest Alembic revision on a database create_all just built."""
+    alembic_config = Config()
+    alembic_config.set_main_option("script_location", MIGRATIONS_DIRECTORY)
+    alembic_config.attributes["connection"] = conn
+    command.stamp(alembic_config, "head")
 
 def create_tables():
-    """Create all database tables."""
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    """Create all database tables in a single transaction.
+
+    create_all never alters existing tables, so a brand-new database is
+    stamped with the latest migration and existing ones are brought up to
+    date with ``alembic upgrade head`` (see alembic.ini).
+    """
+    with engine.begin() as conn:
+        new_database = not inspect(conn).has_table("users")
+        Base.metadata.create_all(bind=conn)
+        if new_database:
+            stamp_schema_head(conn)
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""Enumerations shared by the ORM models and the API layer.
+
+Kept free of SQLAlchemy imports so parsers and schemas can use them cheaply.
+"""
+from enum import Enum
+
+class Role(Enum):
+    owner = "owner"
+    admin = "admin"
+    member = "member"
+
+class AccountType(Enum):
+    bank = "bank"
+    card = "card"
+
+class FileStatus(Enum):
+    uploaded = "uploaded"
+    parsing = "parsing"
+    parsed = "parsed"
+    error = "error"
+
+class RecurrenceType(Enum):
+    no = "no"
+    weekly = "weekly"
+    monthly = "monthly"
+    yearly = "yearly"
+
+class BankAccountStatus(Enum):
+    active = "active"
+    inactive = "inactive"
+    error = "error"
+
+class AccountKind(Enum):
+    checking = "Checking"
+    savings = "Savings"
+    credit_card = "Credit Card"
+    investment = "Investment"
+    loan = "Loan"
+
+class SplitMethod(Enum):
+    equal = "equal"
+    percentage = "percentage"
+    amount = "amount"
+
+class PaidStatus(Enum):
+    pending = "pending"
+    paid = "paid"
+
+class GoalCategory(Enum):
+    emergency = "emergency"
+    home = "home"
+    vacation = "vacation"
+    car = "car"
+    education = "education"
+    retirement = "retirement"
+    family = "family"
+    health = "health"
+
+class GoalStatus(Enum):
+    active = "active"
+    completed = "completed"
+    paused = "paused"
+
+class GoalPriority(Enum):
+    low = "low"
+    medium = "medium"
+    high = "high"
+
+class FileType(Enum):
+    bank_statement = "bank_statement"
+    credit_statement = "credit_statement"
+    csv = "csv"
+    excel = "excel"
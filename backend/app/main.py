@@ -26,31 +26,61 @@ from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from contextlib import asynccontextmanager
 import logging
+import logging.config
+import logging.handlers
+import queue
 import time
 
 # Import configuration and database
 from .database import create_tables
 from .config import settings
-from .auth import get_current_user
-from .models import User
+from .auth import get_current_user, UserContext
 
 # Import all routers
 from .routers import auth_routes, transactions, categories, income, goals, analytics, files, partners, banks
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.log_level),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Configure logging: request threads only enqueue records; a QueueListener thread
+# formats them and writes to the console so slow sinks never stall the workers
+log_queue = queue.SimpleQueue()
+logging.config.dictConfig({
+    "version": 1,
+    "disable_existing_loggers": False,
+    "handlers": {
+        "queue": {
+            "class": "logging.handlers.QueueHandler",
+            "queue": log_queue,
+        },
+    },
+    "root": {"level": settings.log_level, "handlers": ["queue"]},
+})
+console_handler = logging.StreamHandler()
+console_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+log_listener = logging.handlers.QueueListener(log_queue, console_handler, respect_handler_level=True)
+log_listener.start()
 logger = logging.getLogger(__name__)
 
+# Hosts accepted by TrustedHostMiddleware, fixed at startup
+TRUSTED_HOSTS = ("localhost", "127.0.0.1", "*.localhost")
+
 # Configure rate limiting
 limiter = Limiter(key_func=get_remote_address)
 
-# Create database tables on startup
-create_tables()
-logger.info("Database tables created successfully")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: create tables and start the parse pool once per process."""
+    logger.info("Starting Shared Budgeting API v0.4.0 in %s mode", settings.environment)
+    logger.info("Debug mode: %s", settings.debug)
+    logger.info("Database URL: %s", settings.database_url)
+    logger.info("CORS origins: %s", settings.cors_origins)
+    create_tables()
+    logger.info("Database tables created successfully")
+    files.start_parse_pool()
+    yield
+    logger.info("Shutting down Shared Budgeting API")
+    files.shutdown_parse_pool()
+    log_listener.stop()
 
 # Create FastAPI application
 app = FastAPI(
@@ -111,7 +141,8 @@ app = FastAPI(
         {"name": "Goals", "description": "Goal creation and progress tracking"},
         {"name": "Analytics", "description": "Financial analytics and insights"},
         {"name": "File Upload", "description": "Bank statement file processing"},
-    ]
+    ],
+    lifespan=lifespan
 )
 
 # Security middleware
@@ -125,30 +156,37 @@ app.add_middleware(
 
 app.add_middleware(
     TrustedHostMiddleware, 
-    allowed_hosts=["localhost", "127.0.0.1", "*.localhost"]
+    allowed_hosts=TRUSTED_HOSTS
 )
 
 # Add rate limiter to app
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# Requests that are never logged: CORS preflights and load-balancer health probes
+UNLOGGED_PATHS = frozenset({"/health"})
+
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    """Log all HTTP requests with timing information."""
-    start_time = time.time()
+    """Log HTTP requests with timing information (skips preflights and health checks)."""
+    if request.method == "OPTIONS" or request.url.path in UNLOGGED_PATHS:
+        return await call_next(request)
+    
+    start_ns = time.perf_counter_ns()
     response = await call_next(request)
-    process_time = time.time() - start_time
-    logger.info(
-        f"{request.method} {request.url.path} - {response.status_code} - {process_time:.4f}s"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        process_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.info(
+            "%s %s - %s - %.3fms", request.method, request.url.path, response.status_code, process_ms
+        )
     return response
 
 # Global exception handlers
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions."""
-    logger.error(f"Global exception: {str(exc)}", exc_info=True)
+    logger.error("Global exception: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=500,
         content={"detail": "Internal server error occurred"}
@@ -157,12 +195,19 @@ async def global_exception_handler(request: Request, exc: Exception):
 @app.exception_handler(ValueError)
 async def validation_exception_handler(request: Request, exc: ValueError):
     """Handle validation errors."""
-    logger.warning(f"Validation error: {str(exc)}")
+    logger.warning("Validation error: %s", exc)
     return JSONResponse(
         status_code=400,
         content={"detail": str(exc)}
     )
 
+# NOTE: Handlers using sync SQLAlchemy (Depends(get_db) / get_current_user) MUST be
+# declared `def`, not `async def`, so FastAPI dispatches them to the threadpool.
+# An `async def` handler that calls the sync Session blocks the whole event loop.
+# The upload handlers are the only `async def` routes; they await the upload
+# stream and push every blocking parse/DB call (membership check, File record
+# creation, status updates, transaction inserts) through run_in_threadpool.
+
 # Health and monitoring endpoints
 @app.get("/health", tags=["Monitoring"])
 def health_check():
@@ -186,7 +231,7 @@ def debug_endpoint():
     }
 
 @app.get("/debug-auth", tags=["Development"])
-def debug_auth(current_user: User = Depends(get_current_user)):
+def debug_auth(current_user: UserContext = Depends(get_current_user)):
     """Debug endpoint to test authentication (development only)."""
     if settings.environment == "production":
         raise HTTPException(status_code=404, detail="Not found")
@@ -211,21 +256,6 @@ app.include_router(files.router, tags=["File Upload"])
 app.include_router(partners.router, tags=["Partners"])
 app.include_router(banks.router, tags=["Banks"])
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Application startup event."""
-    logger.info(f"Starting Shared Budgeting API v0.4.0 in {settings.environment} mode")
-    logger.info(f"Debug mode: {settings.debug}")
-    logger.info(f"Database URL: {settings.database_url}")
-    logger.info(f"CORS origins: {settings.cors_origins}")
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown event."""
-    logger.info("Shutting down Shared Budgeting API")
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -1,36 +1,41 @@
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, Integer, String, Numeric, ForeignKey, DateTime, func, JSON, Enum as SQLAlchemyEnum, Index
-from sqlalchemy.orm import relationship
-from enum import Enum
+from sqlalchemy import DDL, event, MetaData, Table, Column, Integer, String, Numeric, ForeignKey, DateTime, func, JSON, Enum as SQLAlchemyEnum, Index, CheckConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import declarative_base, relationship, configure_mappers
+
+from .enums import (
+    Role, AccountType, FileStatus, RecurrenceType, BankAccountStatus, AccountKind,
+    SplitMethod, PaidStatus, GoalCategory, GoalStatus, GoalPriority, FileType
+)
 
 Base = declarative_base()
 
-class Role(Enum):
-    owner = "owner"
-    admin = "admin"
-    member = "member"
+def db_enum(enum_cls):
+    """Native enum column type (a PostgreSQL ENUM, 4 bytes per value) named after the class.
 
-class AccountType(Enum):
-    bank = "bank"
-    card = "card"
+    Values are persisted by ``.value`` (e.g. "Credit Card"), not member name.
+    """
+    return SQLAlchemyEnum(
+        enum_cls,
+        name=enum_cls.__name__.lower(),
+        native_enum=True,
+        values_callable=lambda members: [m.value for m in members]
+    )
 
-class FileStatus(Enum):
-    uploaded = "uploaded"
-    parsing = "parsing"
-    parsed = "parsed"
-    error = "error"
+# Fixed-width currency type; unsized NUMERIC costs more per row and per index entry
+Money = Numeric(12, 2)
 
 class User(Base):
     __tablename__ = 'users'
     id = Column(Integer, primary_key=True)
-    name = Column(String)
-    email = Column(String, unique=True, index=True)
+    name = Column(String(255))
+    email = Column(String(255), unique=True, index=True)
     password_hash = Column(String)
     created_at = Column(DateTime, server_default=func.now())
     
     # Relationships
     household_memberships = relationship("HouseholdUser", back_populates="user")
-    transactions = relationship("Transaction", back_populates="user")
+    # Large and never traversed from the user side; query Transaction directly
+    transactions = relationship("Transaction", back_populates="user", lazy="raise_on_sql")
     incomes = relationship("Income", back_populates="user")
     goals = relationship("Goal", back_populates="user")
     files = relationship("File", back_populates="user")
@@ -38,76 +43,107 @@ class User(Base):
 class Household(Base):
     __tablename__ = 'households'
     id = Column(Integer, primary_key=True)
-    name = Column(String)
+    name = Column(String(255))
     created_at = Column(DateTime, server_default=func.now())
     
     # Relationships
     members = relationship("HouseholdUser", back_populates="household")
     accounts = relationship("Account", back_populates="household")
-    files = relationship("File", back_populates="household")
+    files = relationship("File", back_populates="household", lazy="raise_on_sql")
 
 class HouseholdUser(Base):
     __tablename__ = 'household_users'
     id = Column(Integer, primary_key=True)
     household_id = Column(Integer, ForeignKey('households.id'))
     user_id = Column(Integer, ForeignKey('users.id'))
-    role = Column(SQLAlchemyEnum(Role))
+    role = Column(db_enum(Role))
     
     # Relationships
     household = relationship("Household", back_populates="members")
     user = relationship("User", back_populates="household_memberships")
+    
+    # Indexes for better query performance
+    __table_args__ = (
+        Index('ix_household_users_user_household', 'user_id', 'household_id'),
+    )
 
 class Account(Base):
+    # Legacy household account; superseded by BankAccount (no routes create these)
     __tablename__ = 'accounts'
     id = Column(Integer, primary_key=True)
     household_id = Column(Integer, ForeignKey('households.id'))
-    name = Column(String)
-    type = Column(SQLAlchemyEnum(AccountType))
-    last4 = Column(String)
-    currency = Column(String)
+    name = Column(String(255))
+    type = Column(db_enum(AccountType))
+    last4 = Column(String(4))
+    currency = Column(String(3))  # ISO 4217 code
     
     # Relationships
     household = relationship("Household", back_populates="accounts")
     transactions = relationship("Transaction", back_populates="account")
+    
+    __table_args__ = (
+        CheckConstraint(
+            "currency IS NULL OR (length(currency) = 3 AND currency = upper(currency))",
+            name='ck_accounts_currency_iso'
+        ),
+    )
 
 class Transaction(Base):
     __tablename__ = 'transactions'
     id = Column(Integer, primary_key=True)
-    account_id = Column(Integer, ForeignKey('accounts.id'))
+    account_id = Column(Integer, ForeignKey('accounts.id'))  # legacy, prefer bank_account_id
     bank_account_id = Column(Integer, ForeignKey('bank_accounts.id'))
-    date = Column(DateTime)
+    date = Column(DateTime, nullable=False)
     description = Column(String)
-    amount = Column(Numeric)
+    amount = Column(Money, nullable=False)
     category_id = Column(Integer, ForeignKey('categories.id'))
-    user_id = Column(Integer, ForeignKey('users.id')) # original uploader
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False) # original uploader
     source_file_id = Column(Integer, ForeignKey('files.id'))
-    is_recurring = Column(String, default='no')  # no, weekly, monthly, yearly
+    is_recurring = Column(db_enum(RecurrenceType), default=RecurrenceType.no, nullable=False)
     notes = Column(String)
-    tags = Column(JSON)  # Store tags as JSON array
+    tags = Column(JSON().with_variant(JSONB(), 'postgresql'), server_default='[]')  # Store tags as JSON array
     
     # Relationships
     account = relationship("Account", back_populates="transactions")
-    bank_account = relationship("BankAccount", back_populates="transactions")
-    category = relationship("Category", back_populates="transactions")
+    bank_account = relationship("BankAccount", back_populates="transactions", lazy="selectin")
+    category = relationship("Category", back_populates="transactions", lazy="selectin")
     user = relationship("User", back_populates="transactions")
     source_file = relationship("File", back_populates="transactions")
     
     # Indexes for better query performance
     __table_args__ = (
-        Index('ix_transactions_user_id', 'user_id'),
         Index('ix_transactions_date', 'date'),
         Index('ix_transactions_category_id', 'category_id'),
-        Index('ix_transactions_user_date', 'user_id', 'date'),
-        Index('ix_transactions_user_category', 'user_id', 'category_id'),
-        Index('ix_transactions_bank_account', 'bank_account_id'),
+        # Covering on PostgreSQL: monthly SUM(amount) per user is an index-only scan
+        Index('ix_transactions_user_date', 'user_id', 'date', postgresql_include=['amount']),
+        Index('ix_transactions_source_file_date', 'source_file_id', 'date'),
+        Index('ix_transactions_bank_account_date', 'bank_account_id', text('date DESC')),
+        Index('ix_transactions_user_category_date', 'user_id', 'category_id', 'date'),
+        # Partial index: only recurring rows are stored, the 'no' majority is skipped
+        Index(
+            'ix_transactions_recurring', 'is_recurring',
+            postgresql_where=text("is_recurring <> 'no'"),
+            sqlite_where=text("is_recurring <> 'no'"),
+        ),
     )
 
+# GIN index so tag containment lookups (tags @> '["vacation"]') are index probes.
+# PostgreSQL only; elsewhere tags stay plain JSON with no index.
+event.listen(
+    Transaction.__table__,
+    'after_create',
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_transactions_tags "
+        "ON transactions USING gin (tags jsonb_path_ops)"
+    ).execute_if(dialect='postgresql')
+)
+
 class Category(Base):
     __tablename__ = 'categories'
     id = Column(Integer, primary_key=True)
-    name = Column(String)
+    name = Column(String(255))
     parent_id = Column(Integer, ForeignKey('categories.id'))
-    default_budget = Column(Numeric)
+    default_budget = Column(Money)
     
     # Relationships
     parent = relationship("Category", remote_side=[id])
@@ -118,7 +154,7 @@ class Income(Base):
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey('users.id'))
     date = Column(DateTime)
-    amount = Column(Numeric)
+    amount = Column(Money)
     source = Column(String)
     notes = Column(String)
     
@@ -127,50 +163,29 @@ class Income(Base):
     
     # Indexes for better query performance
     __table_args__ = (
-        Index('ix_incomes_user_id', 'user_id'),
         Index('ix_incomes_date', 'date'),
-        Index('ix_incomes_user_date', 'user_id', 'date'),
+        Index('ix_incomes_user_date', 'user_id', 'date', postgresql_include=['amount']),
     )
 
-class GoalCategory(Enum):
-    emergency = "emergency"
-    home = "home"
-    vacation = "vacation"
-    car = "car"
-    education = "education"
-    retirement = "retirement"
-    family = "family"
-    health = "health"
-
-class GoalStatus(Enum):
-    active = "active"
-    completed = "completed"
-    paused = "paused"
-
-class GoalPriority(Enum):
-    low = "low"
-    medium = "medium"
-    high = "high"
-
 class Goal(Base):
     __tablename__ = 'goals'
     id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey('users.id'))
-    name = Column(String)
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    name = Column(String(255))
     description = Column(String)
-    target_amount = Column(Numeric)
-    current_amount = Column(Numeric, default=0)
-    monthly_contribution = Column(Numeric, default=0)
+    target_amount = Column(Money, nullable=False)
+    current_amount = Column(Money, default=0)
+    monthly_contribution = Column(Money, default=0)
     target_date = Column(DateTime)
-    category = Column(SQLAlchemyEnum(GoalCategory))
-    status = Column(SQLAlchemyEnum(GoalStatus), default=GoalStatus.active)
-    priority = Column(SQLAlchemyEnum(GoalPriority), default=GoalPriority.medium)
+    category = Column(db_enum(GoalCategory))
+    status = Column(db_enum(GoalStatus), default=GoalStatus.active)
+    priority = Column(db_enum(GoalPriority), default=GoalPriority.medium)
     recurrence = Column(String)
     created_at = Column(DateTime, server_default=func.now())
     
     # Relationships
     user = relationship("User", back_populates="goals")
-    contributions = relationship("GoalContribution", back_populates="goal")
+    contributions = relationship("GoalContribution", back_populates="goal", lazy="selectin")
     
     # Indexes for better query performance
     __table_args__ = (
@@ -178,6 +193,7 @@ class Goal(Base):
         Index('ix_goals_target_date', 'target_date'),
         Index('ix_goals_status', 'status'),
         Index('ix_goals_category', 'category'),
+        CheckConstraint('target_amount > 0', name='ck_goals_target_amount_positive'),
     )
 
 class GoalContribution(Base):
@@ -185,28 +201,33 @@ class GoalContribution(Base):
     id = Column(Integer, primary_key=True)
     goal_id = Column(Integer, ForeignKey('goals.id'))
     user_id = Column(Integer, ForeignKey('users.id'))
-    amount = Column(Numeric)
+    amount = Column(Money)
     date = Column(DateTime, server_default=func.now())
     notes = Column(String)
     
     # Relationships
     goal = relationship("Goal", back_populates="contributions")
     user = relationship("User")
+    
+    # Indexes for better query performance
+    __table_args__ = (
+        Index('ix_goal_contributions_goal_date', 'goal_id', text('date DESC')),
+    )
 
 class BankAccount(Base):
     __tablename__ = 'bank_accounts'
     id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, ForeignKey('users.id'))
-    bank_name = Column(String)
-    account_type = Column(String)  # Checking, Savings, Credit Card
-    account_number_last4 = Column(String)
-    balance = Column(Numeric, default=0)
-    currency = Column(String, default='USD')
-    is_active = Column(String, default='active')  # active, inactive, error
+    user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    bank_name = Column(String(255))
+    account_type = Column(db_enum(AccountKind))
+    account_number_last4 = Column(String(4))
+    balance = Column(Money, default=0)
+    currency = Column(String(3), default='USD')
+    is_active = Column(db_enum(BankAccountStatus), default=BankAccountStatus.active)
     last_sync = Column(DateTime)
     plaid_account_id = Column(String)  # For Plaid integration
     created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, onupdate=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     # Relationships
     user = relationship("User")
@@ -218,35 +239,29 @@ class SharedExpense(Base):
     household_id = Column(Integer, ForeignKey('households.id'))
     transaction_id = Column(Integer, ForeignKey('transactions.id'))
     paid_by_user_id = Column(Integer, ForeignKey('users.id'))
-    total_amount = Column(Numeric)
-    split_method = Column(String, default='equal')  # equal, percentage, amount
+    total_amount = Column(Money)
+    split_method = Column(db_enum(SplitMethod), default=SplitMethod.equal)
     created_at = Column(DateTime, server_default=func.now())
     
     # Relationships
     household = relationship("Household")
     transaction = relationship("Transaction")
     paid_by = relationship("User")
-    splits = relationship("SharedExpenseSplit", back_populates="shared_expense")
+    splits = relationship("SharedExpenseSplit", back_populates="shared_expense", lazy="selectin")
 
 class SharedExpenseSplit(Base):
     __tablename__ = 'shared_expense_splits'
     id = Column(Integer, primary_key=True)
     shared_expense_id = Column(Integer, ForeignKey('shared_expenses.id'))
     user_id = Column(Integer, ForeignKey('users.id'))
-    amount = Column(Numeric)
-    percentage = Column(Numeric)  # If using percentage split
-    is_paid = Column(String, default='pending')  # pending, paid
+    amount = Column(Money)
+    percentage = Column(Numeric(5, 2))  # If using percentage split
+    is_paid = Column(db_enum(PaidStatus), default=PaidStatus.pending)
     
     # Relationships
     shared_expense = relationship("SharedExpense", back_populates="splits")
     user = relationship("User")
 
-class FileType(Enum):
-    bank_statement = "bank_statement"
-    credit_statement = "credit_statement"
-    csv = "csv"
-    excel = "excel"
-
 class File(Base):
     __tablename__ = 'files'
     id = Column(Integer, primary_key=True)
@@ -255,11 +270,11 @@ class File(Base):
     filename = Column(String)
     original_filename = Column(String)
     file_size = Column(Integer)
-    file_type = Column(SQLAlchemyEnum(FileType))
-    bank_name = Column(String)
+    file_type = Column(db_enum(FileType))
+    bank_name = Column(String(255))
     s3_key = Column(String)
     parsed_json_key = Column(String)
-    status = Column(SQLAlchemyEnum(FileStatus))
+    status = Column(db_enum(FileStatus))
     error_message = Column(String)
     transactions_found = Column(Integer, default=0)
     uploaded_at = Column(DateTime, server_default=func.now())
@@ -269,3 +284,49 @@ class File(Base):
     household = relationship("Household", back_populates="files")
     user = relationship("User", back_populates="files")
     transactions = relationship("Transaction", back_populates="source_file")
+    
+    # Indexes for better query performance
+    __table_args__ = (
+        Index('ix_files_user_uploaded', 'user_id', 'uploaded_at'),
+    )
+
+# Monthly per-user/category spend rollup, precomputed so dashboards read
+# categories x months rows instead of aggregating every transaction.
+# PostgreSQL-only materialized view; it lives on its own MetaData so
+# create_all never tries to create it as a table.
+view_metadata = MetaData()
+
+transaction_monthly = Table(
+    'transaction_monthly', view_metadata,
+    Column('user_id', Integer),
+    Column('category_id', Integer),  # 0 = uncategorized
+    Column('month', DateTime),
+    Column('total_spending', Money),
+    Column('transaction_count', Integer),
+)
+
+event.listen(
+    Base.metadata,
+    'after_create',
+    DDL(
+        "CREATE MATERIALIZED VIEW IF NOT EXISTS transaction_monthly AS "
+        "SELECT user_id, COALESCE(category_id, 0) AS category_id, "
+        "date_trunc('month', date) AS month, "
+        "SUM(CASE WHEN amount < 0 THEN -amount ELSE 0 END) AS total_spending, "
+        "COUNT(*) FILTER (WHERE amount < 0) AS transaction_count "
+        "FROM transactions GROUP BY 1, 2, 3 WITH DATA"
+    ).execute_if(dialect='postgresql')
+)
+# Unique index: PK-style lookups, and required for REFRESH ... CONCURRENTLY
+event.listen(
+    Base.metadata,
+    'after_create',
+    DDL(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_transaction_monthly_user_month_category "
+        "ON transaction_monthly (user_id, month, category_id)"
+    ).execute_if(dialect='postgresql')
+)
+
+# Resolve all mappers (and compile relationship loaders) once at import time
+# rather than on first query
+configure_mappers()
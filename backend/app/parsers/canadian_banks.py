@@ -13,237 +13,378 @@ Each parser handles the specific format and patterns used by these banks.
 """
 
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Optional
 from decimal import Decimal
 from datetime import datetime
+from functools import lru_cache
 
+# Optional Aho-Corasick automaton for bank detection (pyahocorasick)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-def parse_cibc_transaction(line: str) -> Dict[str, Any]:
+# Optional linear-time regex engine (google-re2) for the description patterns
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Description patterns shaped like `[A-Z\s]+VERB` backtrack quadratically under
+# `re` on long runs of capitals with no verb; RE2 matches them in linear time.
+# RE2's \s is ASCII-only, so Python's Unicode whitespace set is spelled out to
+# keep results identical with either engine (statements often carry \xa0).
+DESCRIPTION_REGEX = re2 if re2 is not None else re
+UNICODE_WHITESPACE = '\t\n\x0b\x0c\r\x1c-\x1f \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000'
+
+# Precompiled line patterns, shared across calls instead of going through the
+# re module's pattern cache on every line
+STATEMENT_AMOUNT_PATTERN = re.compile(r'(\d{1,3}(?:,\d{3})*\.\d{2})')  # 1,234.56
+
+CIBC_DATE_PATTERN = re.compile(r'([A-Za-z]{3}\s+\d{1,2})')  # Jan 15
+CIBC_DESCRIPTION_PATTERN = DESCRIPTION_REGEX.compile(rf'([A-Z{UNICODE_WHITESPACE}]+(?P<verb>PURCHASE|PAYMENT|TRANSFER|DEPOSIT|WITHDRAWAL|FEE))')
+
+RBC_DATE_PATTERN = re.compile(r'(\d{4}/\d{1,2}/\d{1,2})')  # 2025/01/15
+RBC_DESCRIPTION_PATTERN = DESCRIPTION_REGEX.compile(rf'([A-Z{UNICODE_WHITESPACE}-]+(?P<verb>TRANSFER|PAYMENT|PURCHASE|DEPOSIT|WITHDRAWAL|FEE))')
+
+# Literal verb scan: the CIBC/RBC/TD descriptions must end in one of these, and
+# this is far cheaper to reject on than the [A-Z\s]+VERB description search
+DESCRIPTION_VERB_PATTERN = re.compile(r'PURCHASE|PAYMENT|TRANSFER|DEPOSIT|WITHDRAWAL|FEE')
+
+# Description verbs that always make a line a debit; when the description
+# regex already captured one, the whole-line keyword scans can be skipped
+DEBIT_VERBS = frozenset({'PURCHASE', 'FEE', 'WITHDRAWAL'})
+
+AMEX_DATE_PATTERN = re.compile(r'([A-Z]{3}\s+\d{1,2})')  # JAN 15
+AMEX_AMOUNT_PATTERN = re.compile(r'\$(\d{1,3}(?:,\d{3})*\.\d{2})')  # $123.45
+AMEX_DESCRIPTION_PATTERN = DESCRIPTION_REGEX.compile(
+    rf'([A-Z{UNICODE_WHITESPACE}]+)(?:[{UNICODE_WHITESPACE}]+[A-Z]{{2}}[{UNICODE_WHITESPACE}]+)?\$'
+)  # Description before amount
+
+TD_DATE_PATTERN = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')  # 15/01/2025
+TD_DESCRIPTION_PATTERN = CIBC_DESCRIPTION_PATTERN
+
+# Statement lines containing something date-shaped; every bank's date pattern
+# implies one of these ("Jan 15"/"JAN 15" or "2025/01/15"/"15/01/2025"), so
+# lines without a match cannot parse. [^\S\n] keeps \s from crossing lines.
+DATED_LINE_PATTERN = re.compile(r'^.*?(?:[A-Za-z]{3}[^\S\n]+\d|\d/\d).*$', re.MULTILINE)
+
+# Month abbreviations for hand-rolled date parsing (strptime re-interprets its
+# format string on every call)
+MONTH_NUMBERS = {
+    'JAN': 1, 'FEB': 2, 'MAR': 3, 'APR': 4, 'MAY': 5, 'JUN': 6,
+    'JUL': 7, 'AUG': 8, 'SEP': 9, 'OCT': 10, 'NOV': 11, 'DEC': 12
+}
+# Lowercase abbreviated and full month names, matching strptime's %b/%B lookup
+MONTH_NAME_NUMBERS = {
+    **{name.lower(): number for name, number in MONTH_NUMBERS.items()},
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'june': 6, 'july': 7,
+    'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+
+# Every format parse_canadian_date_formats accepts, as one alternation. The
+# day/month/year pieces mirror strptime's own %d/%m/%Y/%b/%B expressions so
+# the accepted inputs are unchanged.
+_DAY = r'3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9]'
+_MONTH = r'1[0-2]|0[1-9]|[1-9]'
+CANADIAN_DATE_PATTERN = re.compile(
+    rf'(?P<dmy_d>{_DAY})(?P<dmy_sep>[/-])(?P<dmy_m>{_MONTH})(?P=dmy_sep)(?P<dmy_y>\d\d\d\d)'  # 15/01/2025, 15-01-2025
+    rf'|(?P<ymd_y>\d\d\d\d)(?P<ymd_sep>[/-])(?P<ymd_m>{_MONTH})(?P=ymd_sep)(?P<ymd_d>{_DAY})'  # 2025/01/15, 2025-01-15
+    r'|(?P<abbr_m>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)'
+    rf'\s+(?P<abbr_d>{_DAY})\s+(?P<abbr_y>\d\d\d\d)'  # Jan 15 2025
+    r'|(?P<full_m>september|february|november|december|january|october|august|march|april|june|july|may)'
+    rf'\s+(?P<full_d>{_DAY}),\s+(?P<full_y>\d\d\d\d)',  # January 15, 2025
+    re.IGNORECASE
+)
+
+# Bank code -> statement keywords, in detection priority order (used when
+# several banks are mentioned)
+BANK_KEYWORDS = (
+    ('CIBC', ('CIBC', 'CANADIAN IMPERIAL BANK')),
+    ('RBC', ('ROYAL BANK', 'RBC')),
+    ('AMEX', ('AMERICAN EXPRESS', 'AMEX')),
+    ('TD', ('TD CANADA TRUST', 'TD BANK')),
+    ('BMO', ('BANK OF MONTREAL', 'BMO')),
+    ('SCOTIA', ('SCOTIABANK', 'SCOTIA')),
+    ('TANGERINE', ('TANGERINE',)),
+)
+BANK_DETECTION_ORDER = tuple(bank for bank, _ in BANK_KEYWORDS)
+
+if ahocorasick is not None:
+    # One linear pass over the text finds every (possibly overlapping) keyword
+    BANK_KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _bank, _keywords in BANK_KEYWORDS:
+        for _keyword in _keywords:
+            BANK_KEYWORD_AUTOMATON.add_word(_keyword, _bank)
+    BANK_KEYWORD_AUTOMATON.make_automaton()
+else:
+    BANK_KEYWORD_AUTOMATON = None
+
+# Fallback: the same keywords as one case-insensitive alternation; the group
+# name is the bank code
+BANK_KEYWORD_PATTERN = re.compile(
+    '|'.join(
+        f"(?P<{bank}>{'|'.join(map(re.escape, keywords))})"
+        for bank, keywords in BANK_KEYWORDS
+    ),
+    re.IGNORECASE
+)
+
+
+class ParsedTransaction(NamedTuple):
+    """Immutable parsed statement line; safe to share out of the line cache."""
+    date: datetime
+    description: str
+    amount: Decimal
+    bank: str
+
+
+def parse_cibc_transaction(line: str, current_year: Optional[int] = None) -> Optional[ParsedTransaction]:
     """Parse CIBC transaction line."""
     # CIBC format: Date | Description | Debit | Credit | Balance
     # Example: "Jan 15  GROCERY STORE PURCHASE     45.67         2,345.22"
     
-    patterns = {
-        'date': r'([A-Za-z]{3}\s+\d{1,2})',  # Jan 15
-        'amount': r'(\d{1,3}(?:,\d{3})*\.\d{2})',  # 1,234.56
-        'description': r'([A-Z\s]+(?:PURCHASE|PAYMENT|TRANSFER|DEPOSIT|WITHDRAWAL|FEE))'
-    }
-    
-    date_match = re.search(patterns['date'], line)
-    amount_matches = re.findall(patterns['amount'], line)
-    desc_match = re.search(patterns['description'], line)
+    # Cheapest, most selective check first: most lines are not transactions.
+    # No '.' means no d.dd amount; no verb means no description.
+    if '.' not in line or not DESCRIPTION_VERB_PATTERN.search(line):
+        return None
+    date_match = CIBC_DATE_PATTERN.search(line)
+    if not date_match:
+        return None
+    amount_match = STATEMENT_AMOUNT_PATTERN.search(line)  # first amount on the line
+    if not amount_match:
+        return None
+    desc_match = CIBC_DESCRIPTION_PATTERN.search(line)
+    if not desc_match:
+        return None
     
-    if date_match and amount_matches and desc_match:
-        try:
-            # Parse date (assume current year)
-            date_str = date_match.group(1)
+    try:
+        # Parse date (assume current year)
+        date_str = date_match.group(1)
+        if current_year is None:
             current_year = datetime.now().year
-            date_obj = datetime.strptime(f"{date_str} {current_year}", "%b %d %Y")
-            
-            # Determine if debit or credit based on position
-            # CIBC typically shows: Description | Debit | Credit | Balance
-            amount_str = amount_matches[0].replace(',', '')
-            amount = float(amount_str)
+        month_str, day_str = date_str.split()
+        date_obj = datetime(current_year, MONTH_NUMBERS[month_str.upper()], int(day_str))
+        
+        # Determine if debit or credit based on position
+        # CIBC typically shows: Description | Debit | Credit | Balance
+        amount_str = amount_match.group(1).replace(',', '')
+        amount = Decimal(amount_str)  # exact; no float round-trip
+        
+        # Check context to determine sign
+        if desc_match.group('verb') in DEBIT_VERBS or 'PURCHASE' in line or 'FEE' in line or 'WITHDRAWAL' in line:
+            amount = -abs(amount)
+        elif 'DEPOSIT' in line or ('PAYMENT' in line and 'CARD PAYMENT' not in line):
+            amount = abs(amount)
+        else:
+            # Default to negative for most transactions
+            amount = -abs(amount)
             
-            # Check context to determine sign
-            if 'PURCHASE' in line or 'FEE' in line or 'WITHDRAWAL' in line:
-                amount = -abs(amount)
-            elif 'DEPOSIT' in line or 'PAYMENT' in line and 'CARD PAYMENT' not in line:
-                amount = abs(amount)
-            else:
-                # Default to negative for most transactions
-                amount = -abs(amount)
-                
-            return {
-                'date': date_obj,
-                'description': desc_match.group(1).strip(),
-                'amount': Decimal(str(amount)),
-                'bank': 'CIBC'
-            }
-        except Exception:
-            return None
-    return None
+        return ParsedTransaction(date_obj, desc_match.group(1).strip(), amount, 'CIBC')
+    except Exception:
+        return None
 
 
-def parse_rbc_transaction(line: str) -> Dict[str, Any]:
+def parse_rbc_transaction(line: str, current_year: Optional[int] = None) -> Optional[ParsedTransaction]:
     """Parse RBC transaction line."""
     # RBC format: Date | Description | Withdrawals | Deposits | Balance
     # Example: "2025/01/15  INTERAC E-TRANSFER  25.00    2,320.55"
     
-    patterns = {
-        'date': r'(\d{4}/\d{1,2}/\d{1,2})',  # 2025/01/15
-        'amount': r'(\d{1,3}(?:,\d{3})*\.\d{2})',
-        'description': r'([A-Z\s-]+(?:TRANSFER|PAYMENT|PURCHASE|DEPOSIT|WITHDRAWAL|FEE))'
-    }
-    
-    date_match = re.search(patterns['date'], line)
-    amount_matches = re.findall(patterns['amount'], line)
-    desc_match = re.search(patterns['description'], line)
+    # Cheapest, most selective check first: most lines are not transactions.
+    # No '.' means no d.dd amount; no verb means no description.
+    if '.' not in line or not DESCRIPTION_VERB_PATTERN.search(line):
+        return None
+    date_match = RBC_DATE_PATTERN.search(line)
+    if not date_match:
+        return None
+    amount_match = STATEMENT_AMOUNT_PATTERN.search(line)  # first amount on the line
+    if not amount_match:
+        return None
+    desc_match = RBC_DESCRIPTION_PATTERN.search(line)
+    if not desc_match:
+        return None
     
-    if date_match and amount_matches and desc_match:
-        try:
-            date_obj = datetime.strptime(date_match.group(1), "%Y/%m/%d")
-            
-            amount_str = amount_matches[0].replace(',', '')
-            amount = float(amount_str)
+    try:
+        year_str, month_str, day_str = date_match.group(1).split('/')
+        date_obj = datetime(int(year_str), int(month_str), int(day_str))
+        
+        amount_str = amount_match.group(1).replace(',', '')
+        amount = Decimal(amount_str)  # exact; no float round-trip
+        
+        # RBC context-based signing
+        if desc_match.group('verb') in DEBIT_VERBS or 'PURCHASE' in line or 'FEE' in line or 'WITHDRAWAL' in line:
+            amount = -abs(amount)
+        elif 'DEPOSIT' in line or 'E-TRANSFER' in line:  # 'E-TRANSFER' implies 'TRANSFER'
+            amount = abs(amount)
+        else:
+            amount = -abs(amount)
             
-            # RBC context-based signing
-            if 'PURCHASE' in line or 'FEE' in line or 'WITHDRAWAL' in line:
-                amount = -abs(amount)
-            elif 'DEPOSIT' in line or 'TRANSFER' in line and 'E-TRANSFER' in line:
-                amount = abs(amount)
-            else:
-                amount = -abs(amount)
-                
-            return {
-                'date': date_obj,
-                'description': desc_match.group(1).strip(),
-                'amount': Decimal(str(amount)),
-                'bank': 'RBC'
-            }
-        except Exception:
-            return None
-    return None
+        return ParsedTransaction(date_obj, desc_match.group(1).strip(), amount, 'RBC')
+    except Exception:
+        return None
 
 
-def parse_amex_canada_transaction(line: str) -> Dict[str, Any]:
+def parse_amex_canada_transaction(line: str, current_year: Optional[int] = None) -> Optional[ParsedTransaction]:
     """Parse American Express Canada transaction line."""
     # AMEX format: Date | Description | Amount
     # Example: "JAN 15 GROCERY STORE TORONTO ON $45.67"
     
-    patterns = {
-        'date': r'([A-Z]{3}\s+\d{1,2})',  # JAN 15
-        'amount': r'\$(\d{1,3}(?:,\d{3})*\.\d{2})',  # $123.45
-        'description': r'([A-Z\s]+)(?:\s+[A-Z]{2}\s+)?\$'  # Description before amount
-    }
-    
-    date_match = re.search(patterns['date'], line)
-    amount_match = re.search(patterns['amount'], line)
-    desc_match = re.search(patterns['description'], line)
+    # Cheapest, most selective check first: most lines are not transactions.
+    # No '$' means no AMEX amount.
+    if '$' not in line:
+        return None
+    date_match = AMEX_DATE_PATTERN.search(line)
+    if not date_match:
+        return None
+    amount_match = AMEX_AMOUNT_PATTERN.search(line)
+    if not amount_match:
+        return None
+    desc_match = AMEX_DESCRIPTION_PATTERN.search(line)
+    if not desc_match:
+        return None
     
-    if date_match and amount_match and desc_match:
-        try:
-            date_str = date_match.group(1)
+    try:
+        date_str = date_match.group(1)
+        if current_year is None:
             current_year = datetime.now().year
-            date_obj = datetime.strptime(f"{date_str} {current_year}", "%b %d %Y")
-            
-            amount_str = amount_match.group(1).replace(',', '')
-            amount = float(amount_str)
+        month_str, day_str = date_str.split()
+        date_obj = datetime(current_year, MONTH_NUMBERS[month_str.upper()], int(day_str))
+        
+        amount_str = amount_match.group(1).replace(',', '')
+        amount = Decimal(amount_str)  # exact; no float round-trip
+        
+        # AMEX transactions are typically expenses (negative)
+        amount = -abs(amount)
             
-            # AMEX transactions are typically expenses (negative)
-            amount = -abs(amount)
-                
-            return {
-                'date': date_obj,
-                'description': desc_match.group(1).strip(),
-                'amount': Decimal(str(amount)),
-                'bank': 'AMEX'
-            }
-        except Exception:
-            return None
-    return None
+        return ParsedTransaction(date_obj, desc_match.group(1).strip(), amount, 'AMEX')
+    except Exception:
+        return None
 
 
-def parse_td_transaction(line: str) -> Dict[str, Any]:
+def parse_td_transaction(line: str, current_year: Optional[int] = None) -> Optional[ParsedTransaction]:
     """Parse TD Canada Trust transaction line."""
     # TD format: Date | Description | Debit | Credit | Balance
     # Example: "15/01/2025  INTERAC PURCHASE  67.89    1,234.56"
     
-    patterns = {
-        'date': r'(\d{1,2}/\d{1,2}/\d{4})',  # 15/01/2025
-        'amount': r'(\d{1,3}(?:,\d{3})*\.\d{2})',
-        'description': r'([A-Z\s]+(?:PURCHASE|PAYMENT|TRANSFER|DEPOSIT|WITHDRAWAL|FEE))'
-    }
-    
-    date_match = re.search(patterns['date'], line)
-    amount_matches = re.findall(patterns['amount'], line)
-    desc_match = re.search(patterns['description'], line)
+    # Cheapest, most selective check first: most lines are not transactions.
+    # No '.' means no d.dd amount; no verb means no description.
+    if '.' not in line or not DESCRIPTION_VERB_PATTERN.search(line):
+        return None
+    date_match = TD_DATE_PATTERN.search(line)
+    if not date_match:
+        return None
+    amount_match = STATEMENT_AMOUNT_PATTERN.search(line)  # first amount on the line
+    if not amount_match:
+        return None
+    desc_match = TD_DESCRIPTION_PATTERN.search(line)
+    if not desc_match:
+        return None
     
-    if date_match and amount_matches and desc_match:
-        try:
-            date_obj = datetime.strptime(date_match.group(1), "%d/%m/%Y")
-            
-            amount_str = amount_matches[0].replace(',', '')
-            amount = float(amount_str)
+    try:
+        day_str, month_str, year_str = date_match.group(1).split('/')
+        date_obj = datetime(int(year_str), int(month_str), int(day_str))
+        
+        amount_str = amount_match.group(1).replace(',', '')
+        amount = Decimal(amount_str)  # exact; no float round-trip
+        
+        # TD context-based signing
+        if desc_match.group('verb') in DEBIT_VERBS or 'PURCHASE' in line or 'FEE' in line or 'WITHDRAWAL' in line:
+            amount = -abs(amount)
+        elif 'DEPOSIT' in line or ('TRANSFER' in line and 'RECEIVED' in line):
+            amount = abs(amount)
+        else:
+            amount = -abs(amount)
             
-            # TD context-based signing
-            if 'PURCHASE' in line or 'FEE' in line or 'WITHDRAWAL' in line:
-                amount = -abs(amount)
-            elif 'DEPOSIT' in line or 'TRANSFER' in line and 'RECEIVED' in line:
-                amount = abs(amount)
-            else:
-                amount = -abs(amount)
-                
-            return {
-                'date': date_obj,
-                'description': desc_match.group(1).strip(),
-                'amount': Decimal(str(amount)),
-                'bank': 'TD'
-            }
-        except Exception:
-            return None
-    return None
+        return ParsedTransaction(date_obj, desc_match.group(1).strip(), amount, 'TD')
+    except Exception:
+        return None
 
 
 def detect_canadian_bank(text: str) -> str:
     """Detect which Canadian bank format the text uses."""
-    text_upper = text.upper()
+    # One lazy scan collects the banks mentioned, stopping as soon as the
+    # top-priority bank turns up since nothing can outrank it
+    if BANK_KEYWORD_AUTOMATON is not None:
+        mentioned = (bank for _, bank in BANK_KEYWORD_AUTOMATON.iter(text.upper()))
+    else:
+        mentioned = (match.lastgroup for match in BANK_KEYWORD_PATTERN.finditer(text))
     
-    if 'CIBC' in text_upper or 'CANADIAN IMPERIAL BANK' in text_upper:
-        return 'CIBC'
-    elif 'ROYAL BANK' in text_upper or 'RBC' in text_upper:
-        return 'RBC'
-    elif 'AMERICAN EXPRESS' in text_upper or 'AMEX' in text_upper:
-        return 'AMEX'
-    elif 'TD CANADA TRUST' in text_upper or 'TD BANK' in text_upper:
-        return 'TD'
-    elif 'BANK OF MONTREAL' in text_upper or 'BMO' in text_upper:
-        return 'BMO'
-    elif 'SCOTIABANK' in text_upper or 'SCOTIA' in text_upper:
-        return 'SCOTIA'
-    elif 'TANGERINE' in text_upper:
-        return 'TANGERINE'
+    found = set()
+    for bank in mentioned:
+        if bank == BANK_DETECTION_ORDER[0]:
+            return bank
+        found.add(bank)
+    
+    for bank in BANK_DETECTION_ORDER:
+        if bank in found:
+            return bank
     
     return 'UNKNOWN'
 
 
+# Line parser for each bank with a dedicated statement format
+BANK_PARSERS = {
+    'CIBC': parse_cibc_transaction,
+    'RBC': parse_rbc_transaction,
+    'AMEX': parse_amex_canada_transaction,
+    'TD': parse_td_transaction,
+}
+
+# Parsers tried in order when the bank is unknown, each with a character its
+# date/amount patterns require; a cheap `in` test skips parsers that cannot match.
+# Every parser takes (line, current_year); RBC and TD dates carry their own year.
+UNKNOWN_BANK_PARSERS = (
+    (parse_cibc_transaction, None),
+    (parse_rbc_transaction, '/'),
+    (parse_amex_canada_transaction, '$'),
+    (parse_td_transaction, '/'),
+)
+
+
+def parse_unknown_bank_transaction(line: str, current_year: Optional[int] = None) -> Optional[ParsedTransaction]:
+    """Parse a line from an unrecognized statement by trying each bank format."""
+    # Every parser needs a statement amount (AMEX's $1.23 contains one),
+    # so one shared search rules the line out for all four at once
+    if not STATEMENT_AMOUNT_PATTERN.search(line):
+        return None
+    
+    for parser, required_char in UNKNOWN_BANK_PARSERS:
+        if required_char and required_char not in line:
+            continue
+        transaction = parser(line, current_year)
+        if transaction:
+            return transaction
+    
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_statement_line(line_parser, line: str, current_year: int) -> Optional[ParsedTransaction]:
+    """Parse one candidate line, memoized: page headers and footers repeat on every page."""
+    return line_parser(line, current_year)
+
+
 def parse_canadian_bank_transactions(text: str) -> List[Dict[str, Any]]:
     """
     Parse transactions from Canadian bank statements.
     Auto-detects bank type and applies appropriate parser.
     """
-    transactions = []
     bank_type = detect_canadian_bank(text)
+    current_year = datetime.now().year  # read the clock once, not per line
     
-    lines = text.split('\n')
+    # Resolve the bank's parser once for the whole statement
+    line_parser = BANK_PARSERS.get(bank_type, parse_unknown_bank_transaction)
     
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        transaction = None
-        
-        if bank_type == 'CIBC':
-            transaction = parse_cibc_transaction(line)
-        elif bank_type == 'RBC':
-            transaction = parse_rbc_transaction(line)
-        elif bank_type == 'AMEX':
-            transaction = parse_amex_canada_transaction(line)
-        elif bank_type == 'TD':
-            transaction = parse_td_transaction(line)
-        else:
-            # Try all parsers if bank type unknown
-            for parser in [parse_cibc_transaction, parse_rbc_transaction, 
-                          parse_amex_canada_transaction, parse_td_transaction]:
-                transaction = parser(line)
-                if transaction:
-                    break
-                    
-        if transaction:
-            transactions.append(transaction)
+    # One C-level scan over the whole text yields only the candidate lines,
+    # instead of splitting every line out and searching each in Python
+    lines = (line_match.group().strip() for line_match in DATED_LINE_PATTERN.finditer(text))
     
-    return transactions
+    # Callers (store_transactions) consume the same dict shape as CSV/Excel rows
+    return [
+        transaction._asdict()
+        for transaction in (_parse_statement_line(line_parser, line, current_year) for line in lines)
+        if transaction
+    ]
 
 
 def format_canadian_currency(amount: float) -> str:
@@ -253,19 +394,22 @@ def format_canadian_currency(amount: float) -> str:
 
 def parse_canadian_date_formats(date_str: str) -> datetime:
     """Parse various Canadian date formats."""
-    formats = [
-        "%d/%m/%Y",      # 15/01/2025
-        "%Y/%m/%d",      # 2025/01/15
-        "%b %d %Y",      # Jan 15 2025
-        "%B %d, %Y",     # January 15, 2025
-        "%d-%m-%Y",      # 15-01-2025
-        "%Y-%m-%d",      # 2025-01-15
-    ]
-    
-    for fmt in formats:
+    match = CANADIAN_DATE_PATTERN.fullmatch(date_str)
+    if match:
         try:
-            return datetime.strptime(date_str, fmt)
+            if match.group('dmy_d'):
+                return datetime(int(match.group('dmy_y')), int(match.group('dmy_m')), int(match.group('dmy_d')))
+            if match.group('ymd_y'):
+                return datetime(int(match.group('ymd_y')), int(match.group('ymd_m')), int(match.group('ymd_d')))
+            # Case-insensitive matching also admits look-alikes such as U+017F
+            # for 's'; like strptime, only names that lowercase cleanly count
+            month_name = match.group('abbr_m') or match.group('full_m')
+            month = MONTH_NAME_NUMBERS.get(month_name.lower())
+            if month is not None:
+                if match.group('abbr_m'):
+                    return datetime(int(match.group('abbr_y')), month, int(match.group('abbr_d')))
+                return datetime(int(match.group('full_y')), month, int(match.group('full_d')))
         except ValueError:
-            continue
+            pass  # e.g. 31/02/2025: well-formed but not a real date
             
     raise ValueError(f"Unable to parse date: {date_str}")
\ No newline at end of file
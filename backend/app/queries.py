@@ -0,0 +1,77 @@
+"""
+Shared SQL expressions for the hot dashboard / analytics queries.
+
+Built once at import time so each request reuses the same expression
+objects (and the engine's compiled-statement cache sees a stable shape)
+instead of reconstructing identical CASE/aggregate trees per query.
+"""
+
+import logging
+import threading
+from sqlalchemy import event, func, case, text
+from sqlalchemy.sql.dml import UpdateBase
+from .database import engine
+from .models import Transaction
+
+logger = logging.getLogger(__name__)
+
+# Spend as a positive amount (income rows contribute 0)
+EXPENSE_AMOUNT = case((Transaction.amount < 0, Transaction.amount * -1), else_=0)
+
+# Total spend across the matched transactions
+TOTAL_EXPENSES = func.sum(EXPENSE_AMOUNT)
+
+# Number of expense (negative amount) transactions
+EXPENSE_COUNT = func.count(case((Transaction.amount < 0, Transaction.id), else_=None))
+
+# Seconds to wait after a committed transactions write before refreshing the
+# monthly rollup, so a burst of writes (an upload, a bulk edit) costs one refresh
+TRANSACTION_MONTHLY_REFRESH_DELAY = 5.0
+
+_refresh_timer = None
+_refresh_lock = threading.Lock()
+
+def refresh_transaction_monthly() -> None:
+    """Refresh the PostgreSQL monthly rollup view on its own connection."""
+    global _refresh_timer
+    with _refresh_lock:
+        # Writes committed from here on schedule a fresh refresh
+        _refresh_timer = None
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY transaction_monthly"))
+    except Exception:
+        logger.exception("Refreshing transaction_monthly failed")
+
+def schedule_transaction_monthly_refresh() -> None:
+    """Debounce a background refresh of the monthly rollup off the request path."""
+    global _refresh_timer
+    with _refresh_lock:
+        if _refresh_timer is not None:
+            return
+        _refresh_timer = threading.Timer(TRANSACTION_MONTHLY_REFRESH_DELAY, refresh_transaction_monthly)
+        _refresh_timer.daemon = True
+        _refresh_timer.start()
+
+if engine.dialect.name == "postgresql":
+    # Flag any connection that writes to transactions (ORM flushes and Core
+    # inserts alike) so every writer keeps the rollup fresh on commit
+    @event.listens_for(engine, "after_execute")
+    def mark_transactions_written(conn, clauseelement, multiparams, params, execution_options, result):
+        """Remember that this connection's transaction touched the transactions table."""
+        if (
+            isinstance(clauseelement, UpdateBase)
+            and getattr(clauseelement.table, "name", None) == Transaction.__tablename__
+        ):
+            conn.info["transactions_written"] = True
+
+    @event.listens_for(engine, "commit")
+    def refresh_after_transactions_commit(conn):
+        """Schedule a rollup refresh once transactions writes are committed."""
+        if conn.info.pop("transactions_written", False):
+            schedule_transaction_monthly_refresh()
+
+    @event.listens_for(engine, "rollback")
+    def forget_rolled_back_transactions_writes(conn):
+        """Drop the write flag when the transaction is rolled back."""
+        conn.info.pop("transactions_written", None)
@@ -19,45 +19,69 @@ Features:
 
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case
-from typing import Optional, List
+from sqlalchemy import func
+from typing import Optional, List, Tuple
 from datetime import datetime, timedelta
 from decimal import Decimal
-from calendar import monthrange
 
 from ..database import get_db
-from ..auth import get_current_user
+from ..auth import get_current_user, UserContext
 from ..schemas import (
     SpendingTrend, CategoryAnalysis, MonthlyReport,
     BudgetPerformance, FinancialInsight
 )
-from ..models import User, Transaction, Category, Income, Goal
+from ..models import Transaction, Category, Income, Goal, transaction_monthly
+from ..queries import TOTAL_EXPENSES, EXPENSE_COUNT
 
 # Create router
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
+def month_bounds(year: int, month: int) -> Tuple[datetime, datetime]:
+    """Return the half-open [start, next month start) range for a calendar month."""
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return start, end
+
+def _spending_trends_from_transactions(db: Session, user_id: int, start_date: datetime, end_date: datetime):
+    """Aggregate spending by month directly from transactions (SQLite path)."""
+    return db.query(
+        func.strftime('%Y-%m', Transaction.date).label('period'),
+        TOTAL_EXPENSES.label('total_spending'),
+        EXPENSE_COUNT.label('transaction_count')
+    ).filter(
+        Transaction.user_id == user_id,
+        Transaction.date >= start_date,
+        Transaction.date <= end_date
+    ).group_by(
+        func.strftime('%Y-%m', Transaction.date)
+    ).order_by('period').all()
+
 @router.get("/spending-trends", response_model=List[SpendingTrend])
 def get_spending_trends(
     months: int = Query(12, description="Number of months to analyze"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get spending trends over specified months."""
     end_date = datetime.now()
     start_date = end_date - timedelta(days=30 * months)
     
-    # Query spending by month
-    trends = db.query(
-        func.strftime('%Y-%m', Transaction.date).label('period'),
-        func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0)).label('total_spending'),
-        func.count(case((Transaction.amount < 0, Transaction.id), else_=None)).label('transaction_count')
-    ).filter(
-        Transaction.user_id == current_user.id,
-        Transaction.date >= start_date,
-        Transaction.date <= end_date
-    ).group_by(
-        func.strftime('%Y-%m', Transaction.date)
-    ).order_by('period').all()
+    if db.get_bind().dialect.name == "postgresql":
+        # Read the precomputed monthly rollup (whole months in the window); every
+        # committed transactions write schedules a debounced background refresh
+        trends = db.query(
+            func.to_char(transaction_monthly.c.month, 'YYYY-MM').label('period'),
+            func.sum(transaction_monthly.c.total_spending).label('total_spending'),
+            func.sum(transaction_monthly.c.transaction_count).label('transaction_count')
+        ).filter(
+            transaction_monthly.c.user_id == current_user.id,
+            transaction_monthly.c.month >= func.date_trunc('month', start_date),
+            transaction_monthly.c.month <= end_date
+        ).group_by(
+            transaction_monthly.c.month
+        ).order_by(transaction_monthly.c.month).all()
+    else:
+        trends = _spending_trends_from_transactions(db, current_user.id, start_date, end_date)
     
     result = []
     for trend in trends:
@@ -75,7 +99,7 @@ def get_spending_trends(
 def get_category_analysis(
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get spending analysis by category."""
@@ -97,7 +121,7 @@ def get_category_analysis(
     
     # Get total spending for percentage calculation
     total_spending = db.query(
-        func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0))
+        TOTAL_EXPENSES
     ).filter(
         Transaction.user_id == current_user.id,
         Transaction.date >= start_dt,
@@ -108,8 +132,8 @@ def get_category_analysis(
     category_stats = db.query(
         Transaction.category_id,
         Category.name.label('category_name'),
-        func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0)).label('total_amount'),
-        func.count(case((Transaction.amount < 0, Transaction.id), else_=None)).label('transaction_count'),
+        TOTAL_EXPENSES.label('total_amount'),
+        EXPENSE_COUNT.label('transaction_count'),
         Category.default_budget
     ).join(
         Category, Transaction.category_id == Category.id, isouter=True
@@ -119,7 +143,7 @@ def get_category_analysis(
         Transaction.date <= end_dt
     ).group_by(
         Transaction.category_id, Category.name, Category.default_budget
-    ).order_by(func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0)).desc()).all()
+    ).order_by(TOTAL_EXPENSES.desc()).all()
     
     result = []
     for stat in category_stats:
@@ -148,7 +172,7 @@ def get_category_analysis(
 def get_monthly_report(
     year: int,
     month: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get detailed monthly financial report."""
@@ -158,11 +182,10 @@ def get_monthly_report(
     if year < 1900 or year > 2100:
         raise HTTPException(status_code=400, detail="Invalid year")
     
-    # Get start and end dates for the month
+    # Get the month as a half-open date range; plain range predicates keep
+    # (user_id, date) index scans tight and stay partition-prunable
     try:
-        start_date = datetime(year, month, 1)
-        _, last_day = monthrange(year, month)
-        end_date = datetime(year, month, last_day, 23, 59, 59)
+        start_date, end_date = month_bounds(year, month)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date")
     
@@ -172,15 +195,15 @@ def get_monthly_report(
     ).filter(
         Income.user_id == current_user.id,
         Income.date >= start_date,
-        Income.date <= end_date
+        Income.date < end_date
     ).scalar() or Decimal(0)
     
     expense_total = db.query(
-        func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0))
+        TOTAL_EXPENSES
     ).filter(
         Transaction.user_id == current_user.id,
         Transaction.date >= start_date,
-        Transaction.date <= end_date
+        Transaction.date < end_date
     ).scalar() or Decimal(0)
     
     net_savings = income_total - expense_total
@@ -190,18 +213,18 @@ def get_monthly_report(
     top_categories_query = db.query(
         Transaction.category_id,
         Category.name.label('category_name'),
-        func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0)).label('total_amount'),
-        func.count(case((Transaction.amount < 0, Transaction.id), else_=None)).label('transaction_count')
+        TOTAL_EXPENSES.label('total_amount'),
+        EXPENSE_COUNT.label('transaction_count')
     ).join(
         Category, Transaction.category_id == Category.id, isouter=True
     ).filter(
         Transaction.user_id == current_user.id,
         Transaction.date >= start_date,
-        Transaction.date <= end_date,
+        Transaction.date < end_date,
         Transaction.amount < 0
     ).group_by(
         Transaction.category_id, Category.name
-    ).order_by(func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0)).desc()).limit(5).all()
+    ).order_by(TOTAL_EXPENSES.desc()).limit(5).all()
     
     top_categories = []
     for cat in top_categories_query:
@@ -232,7 +255,7 @@ def get_monthly_report(
 
 @router.get("/budget-performance", response_model=List[BudgetPerformance])
 def get_budget_performance(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get budget vs actual performance for categories where user has transactions."""
@@ -262,7 +285,7 @@ def get_budget_performance(
     for category in categories_with_spending:
         # Get actual spending for this category this month
         actual_spending = db.query(
-            func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0))
+            TOTAL_EXPENSES
         ).filter(
             Transaction.user_id == current_user.id,
             Transaction.category_id == category.id,
@@ -295,7 +318,7 @@ def get_budget_performance(
 
 @router.get("/insights", response_model=List[FinancialInsight])
 def get_financial_insights(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Generate personalized financial insights and recommendations."""
@@ -311,7 +334,7 @@ def get_financial_insights(
     
     for category in categories_with_budgets:
         actual_spending = db.query(
-            func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0))
+            TOTAL_EXPENSES
         ).filter(
             Transaction.user_id == current_user.id,
             Transaction.category_id == category.id,
@@ -354,21 +377,20 @@ def get_financial_insights(
     
     # Spending pattern insights
     last_month_start = (start_of_month - timedelta(days=1)).replace(day=1)
-    last_month_end = start_of_month - timedelta(days=1)
     
     current_month_spending = db.query(
-        func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0))
+        TOTAL_EXPENSES
     ).filter(
         Transaction.user_id == current_user.id,
         Transaction.date >= start_of_month
     ).scalar() or Decimal(0)
     
     last_month_spending = db.query(
-        func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0))
+        TOTAL_EXPENSES
     ).filter(
         Transaction.user_id == current_user.id,
         Transaction.date >= last_month_start,
-        Transaction.date <= last_month_end
+        Transaction.date < start_of_month
     ).scalar() or Decimal(0)
     
     if last_month_spending > 0:
@@ -20,7 +20,7 @@ from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from ..database import get_db
-from ..auth import authenticate_user, create_access_token, get_current_user, get_password_hash
+from ..auth import authenticate_user, create_access_token, get_current_user, get_password_hash, UserContext
 from ..schemas import UserRegistration, UserLogin, Token, UserResponse
 from ..models import User
 
@@ -77,7 +77,7 @@ def login(request: Request, login_data: UserLogin, db: Session = Depends(get_db)
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(current_user: User = Depends(get_current_user)):
+def get_current_user_info(current_user: UserContext = Depends(get_current_user)):
     """Get current user information."""
     return {
         "id": current_user.id,
@@ -11,30 +11,33 @@ This module handles:
 
 from fastapi import APIRouter, HTTPException, Depends, status, Query, UploadFile, File as FastAPIFile
 from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from typing import Optional, List
+from sqlalchemy import func, and_, insert
+from typing import Optional, List, BinaryIO
 from datetime import datetime, timedelta
 from decimal import Decimal
 import os
 import io
 import json
 import uuid
+from itertools import islice
 from pathlib import Path
 
-from ..database import get_db
-from ..auth import get_current_user
+from ..database import get_db, commit_instance
+from ..auth import get_current_user, UserContext
 from ..models import (
-    User, BankAccount, File, FileStatus, FileType,
+    BankAccount, BankAccountStatus, AccountKind, File, FileStatus, FileType,
     Transaction, Category
 )
+from .files import ALLOWED_EXTENSIONS, AMOUNT_STRIP_TABLE
 
 # Create router
 router = APIRouter(prefix="/banks", tags=["Banks"])
 
 @router.get("/accounts")
 def get_bank_accounts(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get user's bank accounts."""
@@ -53,11 +56,11 @@ def get_bank_accounts(
         result.append({
             "id": account.id,
             "bank_name": account.bank_name,
-            "account_type": account.account_type,
+            "account_type": account.account_type.value if account.account_type else None,
             "account_number": f"****{account.account_number_last4}",
             "balance": float(account.balance),
             "currency": account.currency,
-            "status": account.is_active,
+            "status": account.is_active.value if account.is_active else None,
             "last_sync": account.last_sync,
             "recent_transactions": transaction_count,
             "created_at": account.created_at
@@ -71,26 +74,27 @@ def create_bank_account(
     account_type: str,
     account_number_last4: str,
     balance: Optional[float] = 0,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Create a new bank account."""
     # Validate account type
-    valid_types = ["Checking", "Savings", "Credit Card", "Investment", "Loan"]
-    if account_type not in valid_types:
+    try:
+        kind = AccountKind(account_type)
+    except ValueError:
         raise HTTPException(
             status_code=400, 
-            detail=f"Invalid account type. Must be one of: {', '.join(valid_types)}"
+            detail=f"Invalid account type. Must be one of: {', '.join(k.value for k in AccountKind)}"
         )
     
     # Create account
     account = BankAccount(
         user_id=current_user.id,
         bank_name=bank_name,
-        account_type=account_type,
+        account_type=kind,
         account_number_last4=account_number_last4,
         balance=balance or 0,
-        is_active="active",
+        is_active=BankAccountStatus.active,
         last_sync=datetime.now()
     )
     
@@ -103,10 +107,10 @@ def create_bank_account(
         "account": {
             "id": account.id,
             "bank_name": account.bank_name,
-            "account_type": account.account_type,
+            "account_type": account.account_type.value,
             "account_number": f"****{account.account_number_last4}",
             "balance": float(account.balance),
-            "status": account.is_active
+            "status": account.is_active.value
         }
     }
 
@@ -116,7 +120,7 @@ def update_bank_account(
     bank_name: Optional[str] = None,
     account_type: Optional[str] = None,
     balance: Optional[float] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update a bank account."""
@@ -132,17 +136,17 @@ def update_bank_account(
     if bank_name:
         account.bank_name = bank_name
     if account_type:
-        valid_types = ["Checking", "Savings", "Credit Card", "Investment", "Loan"]
-        if account_type not in valid_types:
+        try:
+            account.account_type = AccountKind(account_type)
+        except ValueError:
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid account type. Must be one of: {', '.join(valid_types)}"
+                detail=f"Invalid account type. Must be one of: {', '.join(k.value for k in AccountKind)}"
             )
-        account.account_type = account_type
     if balance is not None:
         account.balance = balance
     
-    account.updated_at = datetime.now()
+    # updated_at is stamped by the column's onupdate=func.now()
     db.commit()
     
     return {"message": "Bank account updated successfully"}
@@ -150,7 +154,7 @@ def update_bank_account(
 @router.delete("/accounts/{account_id}")
 def delete_bank_account(
     account_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Delete a bank account."""
@@ -169,7 +173,7 @@ def delete_bank_account(
     
     if transaction_count > 0:
         # Soft delete - mark as inactive instead of deleting
-        account.is_active = "inactive"
+        account.is_active = BankAccountStatus.inactive
         db.commit()
         return {"message": "Bank account deactivated (has transactions)"}
     else:
@@ -181,7 +185,7 @@ def delete_bank_account(
 @router.post("/accounts/{account_id}/sync")
 def sync_bank_account(
     account_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Manually sync a bank account (placeholder for Plaid integration)."""
@@ -195,7 +199,7 @@ def sync_bank_account(
     
     # Update last sync time
     account.last_sync = datetime.now()
-    account.is_active = "active"
+    account.is_active = BankAccountStatus.active
     db.commit()
     
     # TODO: Implement actual Plaid sync logic here
@@ -212,7 +216,7 @@ def sync_bank_account(
 def get_uploaded_files(
     limit: int = Query(50, description="Number of files to return"),
     status_filter: Optional[str] = Query(None, description="Filter by status"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get user's uploaded files."""
@@ -248,18 +252,17 @@ def get_uploaded_files(
 async def upload_file(
     file: UploadFile = FastAPIFile(...),
     bank_name: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Upload a bank statement file."""
     # Validate file type
-    allowed_extensions = {".pdf", ".csv", ".xlsx", ".xls"}
     file_ext = Path(file.filename).suffix.lower()
     
-    if file_ext not in allowed_extensions:
+    if file_ext not in ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=400,
-            detail=f"File type not supported. Allowed: {', '.join(allowed_extensions)}"
+            detail=f"File type not supported. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
         )
     
     # Determine file type
@@ -269,9 +272,10 @@ async def upload_file(
     elif file_ext in [".xlsx", ".xls"]:
         file_type = FileType.excel
     
-    # Read file content
-    content = await file.read()
-    file_size = len(content)
+    # Measure the (spooled) upload without buffering it into memory
+    file.file.seek(0, os.SEEK_END)
+    file_size = file.file.tell()
+    file.file.seek(0)
     
     # Create unique filename
     unique_filename = f"{uuid.uuid4()}{file_ext}"
@@ -291,13 +295,11 @@ async def upload_file(
         transactions_found=0
     )
     
-    db.add(db_file)
-    db.commit()
-    db.refresh(db_file)
+    await run_in_threadpool(commit_instance, db, db_file)
     
     # TODO: Queue for processing
     # For demonstration, we'll simulate processing
-    await simulate_file_processing(db_file, db, content)
+    await simulate_file_processing(db_file, db, file.file)
     
     return {
         "message": "File uploaded successfully",
@@ -306,51 +308,57 @@ async def upload_file(
         "status": "uploaded"
     }
 
-async def simulate_file_processing(db_file: File, db: Session, content: bytes):
+async def simulate_file_processing(db_file: File, db: Session, stream: BinaryIO):
     """Simulate file processing (replace with actual implementation)."""
     try:
-        # Update status to processing
-        db_file.status = FileStatus.parsing
-        db.commit()
+        # Update status to processing (sync SQLAlchemy work runs in the threadpool)
+        await run_in_threadpool(commit_instance, db, db_file, status=FileStatus.parsing)
         
         # Simulate parsing delay
         import asyncio
         await asyncio.sleep(1)
         
-        # Mock transaction extraction
+        # Mock transaction extraction (sync SQLAlchemy work runs in the threadpool)
         if db_file.file_type == FileType.csv:
             # Simulate CSV parsing
-            transactions_found = simulate_csv_parsing(content, db_file, db)
+            transactions_found = await run_in_threadpool(simulate_csv_parsing, stream, db_file, db)
         elif db_file.file_type == FileType.bank_statement:
             # Simulate PDF parsing
-            transactions_found = simulate_pdf_parsing(content, db_file, db)
+            transactions_found = await run_in_threadpool(simulate_pdf_parsing, stream, db_file, db)
         else:
             transactions_found = 0
         
         # Update file status
-        db_file.status = FileStatus.parsed
-        db_file.transactions_found = transactions_found
-        db_file.processed_at = datetime.now()
-        db.commit()
+        await run_in_threadpool(
+            commit_instance, db, db_file,
+            status=FileStatus.parsed,
+            transactions_found=transactions_found,
+            processed_at=func.now()
+        )
         
     except Exception as e:
         # Handle processing errors
-        db_file.status = FileStatus.error
-        db_file.error_message = str(e)
-        db.commit()
+        await run_in_threadpool(
+            commit_instance, db, db_file,
+            status=FileStatus.error,
+            error_message=str(e)
+        )
 
-def simulate_csv_parsing(content: bytes, db_file: File, db: Session) -> int:
+def simulate_csv_parsing(stream: BinaryIO, db_file: File, db: Session) -> int:
     """Simulate CSV file parsing and transaction creation."""
     try:
-        # Decode CSV content
-        csv_content = content.decode('utf-8')
-        lines = csv_content.strip().split('\n')
+        # Decode CSV content lazily; only the header and first rows are ever read
+        reader = io.TextIOWrapper(stream, encoding='utf-8')
+        try:
+            lines = [line.rstrip('\r\n') for line in islice(reader, 6)]
+        finally:
+            reader.detach()  # Leave the upload stream open for its owner
         
         if len(lines) < 2:  # Need header + at least one data row
             return 0
         
         # Skip header and process data rows
-        transactions_created = 0
+        rows = []
         for line in lines[1:6]:  # Limit to first 5 transactions for demo
             try:
                 parts = line.split(',')
@@ -367,30 +375,29 @@ def simulate_csv_parsing(content: bytes, db_file: File, db: Session) -> int:
                         transaction_date = datetime.strptime(date_str, '%m/%d/%Y')
                     
                     # Parse amount
-                    amount = float(amount_str.replace('$', '').replace(',', ''))
-                    
-                    # Create transaction
-                    transaction = Transaction(
-                        user_id=db_file.user_id,
-                        date=transaction_date,
-                        description=description,
-                        amount=amount,
-                        source_file_id=db_file.id
-                    )
+                    amount = float(amount_str.translate(AMOUNT_STRIP_TABLE))
                     
-                    db.add(transaction)
-                    transactions_created += 1
+                    rows.append({
+                        "user_id": db_file.user_id,
+                        "date": transaction_date,
+                        "description": description,
+                        "amount": amount,
+                        "source_file_id": db_file.id
+                    })
                     
             except Exception as e:
                 continue  # Skip invalid rows
         
+        # Single executemany INSERT instead of one ORM flush per row
+        if rows:
+            db.execute(insert(Transaction.__table__), rows)
         db.commit()
-        return transactions_created
+        return len(rows)
         
     except Exception:
         return 0
 
-def simulate_pdf_parsing(content: bytes, db_file: File, db: Session) -> int:
+def simulate_pdf_parsing(stream: BinaryIO, db_file: File, db: Session) -> int:
     """Simulate PDF file parsing and transaction creation."""
     # For demo purposes, create some mock transactions
     try:
@@ -401,21 +408,20 @@ def simulate_pdf_parsing(content: bytes, db_file: File, db: Session) -> int:
             {"date": "2025-08-04", "description": "Electric Bill", "amount": -89.99},
         ]
         
-        transactions_created = 0
-        for mock_txn in mock_transactions:
-            transaction = Transaction(
-                user_id=db_file.user_id,
-                date=datetime.strptime(mock_txn["date"], '%Y-%m-%d'),
-                description=mock_txn["description"],
-                amount=mock_txn["amount"],
-                source_file_id=db_file.id
-            )
-            
-            db.add(transaction)
-            transactions_created += 1
+        rows = [
+            {
+                "user_id": db_file.user_id,
+                "date": datetime.strptime(mock_txn["date"], '%Y-%m-%d'),
+                "description": mock_txn["description"],
+                "amount": mock_txn["amount"],
+                "source_file_id": db_file.id
+            }
+            for mock_txn in mock_transactions
+        ]
         
+        db.execute(insert(Transaction.__table__), rows)
         db.commit()
-        return transactions_created
+        return len(rows)
         
     except Exception:
         return 0
@@ -423,7 +429,7 @@ def simulate_pdf_parsing(content: bytes, db_file: File, db: Session) -> int:
 @router.delete("/files/{file_id}")
 def delete_file(
     file_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Delete an uploaded file."""
@@ -456,7 +462,7 @@ def delete_file(
 @router.get("/files/{file_id}/transactions")
 def get_file_transactions(
     file_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get transactions extracted from a file."""
@@ -468,27 +474,29 @@ def get_file_transactions(
     if not file:
         raise HTTPException(status_code=404, detail="File not found")
     
-    # Get transactions from this file
-    transactions = db.query(Transaction).filter(
+    # Get transactions from this file as plain column rows (no ORM hydration),
+    # with category names resolved by the same query
+    transactions = db.query(
+        Transaction.id,
+        Transaction.date,
+        Transaction.description,
+        Transaction.amount,
+        Transaction.category_id,
+        Category.name.label("category_name")
+    ).outerjoin(
+        Category, Transaction.category_id == Category.id
+    ).filter(
         Transaction.source_file_id == file.id
-    ).order_by(Transaction.date.desc()).all()
+    ).order_by(Transaction.date.desc()).yield_per(500)  # Fetch in batches, not all at once
     
-    result = []
-    for txn in transactions:
-        category_name = None
-        if txn.category_id:
-            category = db.query(Category).filter(Category.id == txn.category_id).first()
-            if category:
-                category_name = category.name
-        
-        result.append({
-            "id": txn.id,
-            "date": txn.date,
-            "description": txn.description,
-            "amount": float(txn.amount),
-            "category_name": category_name,
-            "category_id": txn.category_id
-        })
+    result = [{
+        "id": txn.id,
+        "date": txn.date,
+        "description": txn.description,
+        "amount": float(txn.amount),
+        "category_name": txn.category_name,
+        "category_id": txn.category_id
+    } for txn in transactions]
     
     return {
         "file": {
@@ -502,7 +510,7 @@ def get_file_transactions(
 
 @router.get("/integration-status")
 def get_integration_status(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get bank integration status."""
@@ -513,11 +521,11 @@ def get_integration_status(
     
     integrations = []
     for account in accounts:
-        status = "connected" if account.is_active == "active" else "error"
+        status = "connected" if account.is_active == BankAccountStatus.active else "error"
         
         integrations.append({
             "bank_name": account.bank_name,
-            "account_type": account.account_type,
+            "account_type": account.account_type.value if account.account_type else None,
             "status": status,
             "last_sync": account.last_sync,
             "account_id": account.id
@@ -21,9 +21,10 @@ from sqlalchemy.orm import Session
 from typing import List
 
 from ..database import get_db
-from ..auth import get_current_user
+from ..auth import get_current_user, UserContext
 from ..schemas import CategoryCreate, CategoryResponse, CategoryUpdate
-from ..models import User, Category, Transaction
+from ..models import Category, Transaction
+from ..cache import invalidate_category_names
 
 # Create router
 router = APIRouter(prefix="/categories", tags=["Categories"])
@@ -45,21 +46,19 @@ def get_default_categories():
 
 @router.get("", response_model=List[CategoryResponse])
 def get_categories(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get all categories. Creates default categories if none exist."""
     categories = db.query(Category).all()
     
-    # If no categories exist, create default ones
+    # If no categories exist, create default ones in a single batched insert
     if not categories:
-        default_categories = get_default_categories()
-        for cat_data in default_categories:
-            category = Category(**cat_data)
-            db.add(category)
-        
+        categories = [Category(**cat_data) for cat_data in get_default_categories()]
+        db.bulk_save_objects(categories, return_defaults=True)
         db.commit()
-        categories = db.query(Category).all()
+        # Bulk saves skip mapper events, so drop the cached name map by hand
+        invalidate_category_names()
     
     return [{
         "id": cat.id,
@@ -71,7 +70,7 @@ def get_categories(
 @router.post("", response_model=CategoryResponse)
 def create_category(
     category: CategoryCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Create a new category."""
@@ -106,7 +105,7 @@ def create_category(
 @router.get("/{category_id}", response_model=CategoryResponse)
 def get_category(
     category_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get a specific category."""
@@ -125,7 +124,7 @@ def get_category(
 def update_category(
     category_id: int,
     category_update: CategoryUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update a category."""
@@ -170,7 +169,7 @@ def update_category(
 @router.delete("/{category_id}")
 def delete_category(
     category_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Delete a category."""
@@ -18,31 +18,59 @@ Features:
 """
 
 import os
+import io
+import asyncio
 import tempfile
 import re
-from typing import List, Dict, Any
-from decimal import Decimal
+import hashlib
+import importlib.util
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import List, Dict, Any, Optional, Tuple
+from decimal import Decimal, InvalidOperation
 from datetime import datetime
+from calendar import monthrange
 
 from fastapi import APIRouter, UploadFile, File as FastAPIFile, HTTPException, Depends, status, Request
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-from ..database import get_db
-from ..auth import get_current_user
-from ..models import User, File, FileStatus, Transaction, Category
+from ..database import get_db, commit_instance
+from ..auth import get_current_user, user_in_household, UserContext
+from ..models import File, FileStatus, Transaction
+from ..cache import get_category_names
 from ..config import settings
-from ..parsers import parse_canadian_bank_transactions
+from ..parsers import parse_canadian_bank_transactions, parse_canadian_date_formats
 
 # Import parsing libraries
 import pdfplumber
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
 try:
     import pandas as pd
 except (ImportError, ValueError) as e:
     # Handle both ImportError and numpy compatibility issues
     pd = None
     print(f"Pandas import failed: {e}. CSV/Excel parsing will be disabled.")
+# pandas' multithreaded C++ CSV reader, when pyarrow is installed
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+# Optional Aho-Corasick automaton for categorization keywords (pyahocorasick)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Create router
 router = APIRouter(prefix="", tags=["File Upload"])
@@ -50,10 +78,92 @@ router = APIRouter(prefix="", tags=["File Upload"])
 # Rate limiter
 limiter = Limiter(key_func=get_remote_address)
 
+# Common spreadsheet column name mappings (frozensets: one hash probe per header)
+SPREADSHEET_COLUMN_MAPPINGS = {
+    'date': frozenset({'date', 'Date', 'DATE', 'transaction_date', 'Transaction Date'}),
+    'description': frozenset({'description', 'Description', 'DESC', 'memo', 'Memo', 'details', 'Details'}),
+    'amount': frozenset({'amount', 'Amount', 'AMOUNT', 'value', 'Value', 'transaction_amount', 'debit', 'credit'})
+}
+
+# CSV column name mappings, including Canadian bank export headers
+CSV_COLUMN_MAPPINGS = {
+    'date': frozenset({'date', 'Date', 'DATE', 'transaction_date', 'Transaction Date', 'Transaction_Date', 'Posting Date', 'posting_date'}),
+    'description': frozenset({'description', 'Description', 'DESC', 'memo', 'Memo', 'details', 'Details', 'Transaction Details', 'Payee', 'Reference'}),
+    'amount': frozenset({'amount', 'Amount', 'AMOUNT', 'value', 'Value', 'transaction_amount', 'debit', 'credit', 'Debit', 'Credit', 'CAD$', 'CAD'})
+}
+
+# Worker processes for CPU-bound statement parsing, started by the app lifespan
+PARSE_POOL: Optional[ProcessPoolExecutor] = None
+
+# CSV encodings in detection order; latin-1 decodes any byte string, so it goes last
+CSV_ENCODINGS = ('utf-8', 'cp1252', 'latin-1')
+
+# Supported statement file extensions
+ALLOWED_EXTENSIONS = frozenset({'.pdf', '.csv', '.xlsx', '.xls'})
+
+# Precompiled patterns used on every upload / every parsed line
+UNSAFE_FILENAME_CHARS_PATTERN = re.compile(r'[<>:"/\\|?*]')
+PDF_DATE_HINT_PATTERN = re.compile(r'\d{1,4}[/-]\d{1,2}[/-]\d{1,4}|\b[A-Za-z]{3}\s+\d{1,2}\b')
+GENERIC_DATE_PATTERN = re.compile(r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\b')
+GENERIC_AMOUNT_PATTERN = re.compile(r'[-+]?\$?[\d,]+\.?\d*')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# Generic-PDF sign keywords in priority order: any debit keyword beats any credit one
+SIGN_KEYWORD_PATTERN = re.compile(r'(?P<debit>debit|withdrawal|purchase)|(?P<credit>credit|deposit)')
+
+# Auto-categorization rules: category name -> description keywords, checked in
+# order (first category with a keyword hit wins)
+CATEGORY_KEYWORDS = (
+    ('groceries', ('grocery', 'supermarket', 'food', 'loblaws', 'metro', 'sobeys', 'walmart')),
+    ('food & dining', ('restaurant', 'coffee', 'tim hortons', 'starbucks', 'mcdonald', 'pizza', 'cafe')),
+    ('transportation', ('gas station', 'petro', 'shell', 'esso', 'transit', 'uber', 'taxi', 'parking')),
+    ('shopping', ('purchase', 'amazon', 'store', 'mall', 'shop')),
+    ('bills & utilities', ('bank fee', 'service charge', 'utility', 'hydro', 'rogers', 'bell', 'telus')),
+    ('entertainment', ('movie', 'entertainment', 'spotify', 'netflix', 'game')),
+    ('healthcare', ('pharmacy', 'medical', 'hospital', 'dental', 'doctor')),
+    ('travel', ('hotel', 'airline', 'flight', 'booking')),
+    ('personal care', ('salon', 'spa', 'cosmetic')),
+    ('education', ('school', 'university', 'course', 'tuition')),
+)
+INCOME_KEYWORDS = ('salary', 'deposit', 'payment', 'refund', 'transfer', 'income')
+
+# Each keyword list as one compiled alternation: a single search per category
+# instead of a Python-level any() over its keywords
+CATEGORY_KEYWORD_PATTERNS = tuple(
+    (category_name, re.compile('|'.join(map(re.escape, keywords))))
+    for category_name, keywords in CATEGORY_KEYWORDS
+)
+INCOME_KEYWORD_PATTERN = re.compile('|'.join(map(re.escape, INCOME_KEYWORDS)))
+
+if ahocorasick is not None:
+    # One linear pass over a description finds every rule keyword it contains;
+    # the payload is the rule's index, i.e. its priority
+    CATEGORY_KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _index, (_, _keywords) in enumerate(CATEGORY_KEYWORDS):
+        for _keyword in _keywords:
+            CATEGORY_KEYWORD_AUTOMATON.add_word(_keyword, _index)
+    CATEGORY_KEYWORD_AUTOMATON.make_automaton()
+else:
+    CATEGORY_KEYWORD_AUTOMATON = None
+
+# Deletes currency symbols / thousands separators from amounts in one C-level pass
+AMOUNT_STRIP_TABLE = str.maketrans('', '', '$,')
+
+def parse_amount(value) -> Decimal:
+    """Convert a CSV/Excel amount cell to Decimal; text goes straight to Decimal without a float round-trip."""
+    if isinstance(value, str):
+        value = value.translate(AMOUNT_STRIP_TABLE).strip()
+        if value.startswith('(') and value.endswith(')'):
+            value = '-' + value[1:-1]  # (12.50) is accounting notation for -12.50
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            raise ValueError(f"Invalid amount: {value!r}")
+    return Decimal(str(float(value)))
+
 def sanitize_filename(filename: str) -> str:
     """Sanitize uploaded filename."""
     # Remove path separators and dangerous characters
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
+    filename = UNSAFE_FILENAME_CHARS_PATTERN.sub('', filename)
     # Limit length
     if len(filename) > 255:
         filename = filename[:255]
@@ -61,74 +171,176 @@ def sanitize_filename(filename: str) -> str:
 
 def validate_file_type(filename: str) -> bool:
     """Validate file type based on extension."""
-    allowed_extensions = {'.pdf', '.csv', '.xlsx', '.xls'}
-    file_ext = os.path.splitext(filename.lower())[1]
-    return file_ext in allowed_extensions
+    return os.path.splitext(filename)[1].lower() in ALLOWED_EXTENSIONS
 
-def parse_pdf_transactions(file_path: str) -> List[Dict[str, Any]]:
-    """Parse transactions from PDF file with Canadian bank support."""
-    transactions = []
+def _parse_pdf_pdfium(file_path: str) -> List[str]:
+    """Extract stripped, non-empty text lines from a PDF file using PDFium (text only)."""
+    lines = []
+    
+    try:
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                lines.extend(filter(None, map(str.strip, textpage.get_text_range().splitlines())))
+                textpage.close()
+                page.close()
+        finally:
+            pdf.close()
+    
+    except Exception as e:
+        raise ValueError(f"Error parsing PDF: {str(e)}")
+    
+    return lines
+
+def _parse_pdf_pymupdf(file_path: str) -> List[str]:
+    """Extract stripped, non-empty text lines (page text, plus table rows for dateless pages) from a PDF file using PyMuPDF."""
+    lines = []
+    
+    try:
+        doc = fitz.open(file_path)
+        try:
+            for page in doc:
+                page_lines = list(filter(None, map(str.strip, page.get_text().splitlines())))
+                lines.extend(page_lines)
+                
+                # Table detection (PyMuPDF >= 1.23) costs far more than the text
+                # pass, so only fall back to it for pages whose text has no
+                # date-like hits, i.e. where the rows were lost to the layout
+                if any(PDF_DATE_HINT_PATTERN.search(line) for line in page_lines):
+                    continue
+                for table in page.find_tables().tables:
+                    for row in table.extract():
+                        if row and len(row) >= 3:  # Basic validation
+                            lines.append(" ".join(str(cell) for cell in row if cell))
+        finally:
+            doc.close()
+    
+    except Exception as e:
+        raise ValueError(f"Error parsing PDF: {str(e)}")
+    
+    return lines
+
+def _parse_pdf(file_path: str) -> List[str]:
+    """Extract stripped, non-empty text lines from a PDF file with the configured backend.
+
+    PyMuPDF and PDFium are C engines and much faster than pdfplumber's pure-Python
+    pdfminer pipeline; pdfplumber is used when the configured backend is not
+    installed, or when PyMuPDF finds no date-like text (e.g. unusual encodings).
+    """
+    backend = settings.pdf_text_backend
+    if fitz and backend == "pymupdf":
+        lines = _parse_pdf_pymupdf(file_path)
+        if any(PDF_DATE_HINT_PATTERN.search(line) for line in lines):
+            return lines
+    elif pdfium and backend == "pdfium":
+        return _parse_pdf_pdfium(file_path)
+    
+    return _parse_pdf_pdfplumber(file_path)
+
+def _parse_pdf_pdfplumber(file_path: str) -> List[str]:
+    """Extract stripped, non-empty text lines (page text plus flattened table rows) from a PDF file using pdfplumber."""
+    lines = []
     
     try:
         with pdfplumber.open(file_path) as pdf:
-            text = ""
             for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+                # Single strip per line; blank lines are dropped at C level
+                lines.extend(filter(None, map(str.strip, (page.extract_text() or "").splitlines())))
                 
                 # Also try table extraction
                 tables = page.extract_tables()
                 for table in tables:
                     for row in table:
                         if row and len(row) >= 3:  # Basic validation
-                            text += " ".join(str(cell) for cell in row if cell) + "\n"
+                            lines.append(" ".join(str(cell) for cell in row if cell))
+                
+                # Drop the page's cached layout objects and text map so memory
+                # stays flat regardless of how many pages the statement has
+                page.close()
     
     except Exception as e:
         raise ValueError(f"Error parsing PDF: {str(e)}")
     
+    return lines
+
+def parse_generic_date(date_str: str) -> Optional[datetime]:
+    """Parse a GENERIC_DATE_PATTERN match (e.g. 15/01/2025, 01-15-25) without strptime.
+
+    Dispatches on separator and year width and validates fields arithmetically,
+    preserving the previous strptime fallback order: '/' with a 4-digit year is
+    day-first then month-first, '-' with a 4-digit year is month-first then
+    day-first, and 2-digit years are always month-first.
+    """
+    separator = '/' if '/' in date_str else '-'
+    parts = date_str.split(separator)
+    if len(parts) != 3:
+        return None  # Mixed separators
+    
+    first, second, year_str = parts
+    first, second = int(first), int(second)
+    if len(year_str) == 4:
+        year = int(year_str)
+        if separator == '/':
+            candidates = ((second, first), (first, second))  # (month, day)
+        else:
+            candidates = ((first, second), (second, first))
+    elif len(year_str) == 2:
+        # Same pivot as strptime's %y: 69-99 -> 19xx, 00-68 -> 20xx
+        year = int(year_str)
+        year += 1900 if year >= 69 else 2000
+        candidates = ((first, second),)
+    else:
+        return None
+    
+    if year < 1:
+        return None
+    for month, day in candidates:
+        if 1 <= month <= 12 and 1 <= day <= monthrange(year, month)[1]:
+            return datetime(year, month, day)
+    return None
+
+def parse_pdf_transactions(file_path: str) -> List[Dict[str, Any]]:
+    """Parse transactions from PDF file with Canadian bank support."""
+    transactions = []
+    lines = _parse_pdf(file_path)
+    text = "\n".join(lines)
+    
     # First try Canadian bank parsing
     canadian_transactions = parse_canadian_bank_transactions(text)
     if canadian_transactions:
         return canadian_transactions
     
     # Fallback to generic parsing
-    lines = text.split('\n')
-    date_pattern = r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\b'
-    amount_pattern = r'[-+]?\$?[\d,]+\.?\d*'
-    
     for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
         # Look for date patterns
-        date_matches = re.findall(date_pattern, line)
+        date_matches = GENERIC_DATE_PATTERN.findall(line)
         if date_matches:
             try:
                 # Parse date
                 date_str = date_matches[0]
                 # Handle different date formats including Canadian formats
-                for fmt in ['%d/%m/%Y', '%Y/%m/%d', '%m/%d/%Y', '%m/%d/%y', '%m-%d-%Y', '%m-%d-%y', '%d-%m-%Y']:
-                    try:
-                        transaction_date = datetime.strptime(date_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
+                transaction_date = parse_generic_date(date_str)
+                if transaction_date is None:
                     continue  # Skip if date parsing fails
                 
                 # Look for amounts
-                amounts = re.findall(amount_pattern, line)
+                amounts = GENERIC_AMOUNT_PATTERN.findall(line)
                 if amounts:
                     # Take the last amount as it's usually the transaction amount
-                    amount_str = amounts[-1].replace('$', '').replace(',', '')
+                    amount_str = amounts[-1].translate(AMOUNT_STRIP_TABLE)
                     try:
-                        amount = float(amount_str)
-                        # Determine if it's a debit or credit based on context
-                        if 'debit' in line.lower() or 'withdrawal' in line.lower() or 'purchase' in line.lower():
+                        amount = Decimal(amount_str)  # exact; no float round-trip
+                        # Determine if it's a debit or credit based on context:
+                        # one scan, stopping at the first (highest-priority) debit hit
+                        sign = None
+                        for keyword_match in SIGN_KEYWORD_PATTERN.finditer(line.lower()):
+                            sign = keyword_match.lastgroup
+                            if sign == 'debit':
+                                break
+                        if sign == 'debit':
                             amount = -abs(amount)
-                        elif 'credit' in line.lower() or 'deposit' in line.lower():
+                        elif sign == 'credit':
                             amount = abs(amount)
                         elif amount > 0:
                             # Assume expenses are negative
@@ -141,16 +353,16 @@ def parse_pdf_transactions(file_path: str) -> List[Dict[str, Any]]:
                         for amount_match in amounts:
                             description = description.replace(amount_match, '').strip()
                         
-                        description = re.sub(r'\s+', ' ', description)  # Clean up whitespace
+                        description = WHITESPACE_PATTERN.sub(' ', description)  # Clean up whitespace
                         
                         if description and len(description) > 3:  # Basic description validation
                             transactions.append({
                                 'date': transaction_date,
                                 'description': description[:200],  # Limit description length
-                                'amount': Decimal(str(amount))
+                                'amount': amount
                             })
                     
-                    except (ValueError, TypeError):
+                    except (ValueError, TypeError, InvalidOperation):
                         continue  # Skip invalid amounts
             
             except Exception:
@@ -166,26 +378,26 @@ def parse_csv_transactions(file_path: str) -> List[Dict[str, Any]]:
     transactions = []
     
     try:
-        # Try different encodings
-        for encoding in ['utf-8', 'latin-1', 'cp1252']:
+        # Detect the encoding up front: pyarrow does not raise on invalid UTF-8
+        # (it returns the column as bytes), so a read-and-retry loop never falls back
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        for encoding in CSV_ENCODINGS:
             try:
-                df = pd.read_csv(file_path, encoding=encoding)
+                raw.decode(encoding)
                 break
             except UnicodeDecodeError:
                 continue
         else:
             raise ValueError("Could not read CSV file with any supported encoding")
         
-        # Common column name mappings including Canadian bank formats
-        column_mappings = {
-            'date': ['date', 'Date', 'DATE', 'transaction_date', 'Transaction Date', 'Transaction_Date', 'Posting Date', 'posting_date'],
-            'description': ['description', 'Description', 'DESC', 'memo', 'Memo', 'details', 'Details', 'Transaction Details', 'Payee', 'Reference'],
-            'amount': ['amount', 'Amount', 'AMOUNT', 'value', 'Value', 'transaction_amount', 'debit', 'credit', 'Debit', 'Credit', 'CAD$', 'CAD']
-        }
+        # pyarrow is only trusted with UTF-8; legacy encodings go through the C reader
+        engine = CSV_ENGINE if encoding == 'utf-8' else 'c'
+        df = pd.read_csv(io.BytesIO(raw), encoding=encoding, engine=engine)
         
         # Find actual column names
         actual_columns = {}
-        for field, possible_names in column_mappings.items():
+        for field, possible_names in CSV_COLUMN_MAPPINGS.items():
             for col_name in df.columns:
                 if col_name in possible_names:
                     actual_columns[field] = col_name
@@ -194,43 +406,43 @@ def parse_csv_transactions(file_path: str) -> List[Dict[str, Any]]:
         if 'date' not in actual_columns or 'amount' not in actual_columns:
             raise ValueError("Required columns (date, amount) not found in CSV")
         
+        # Pull whole columns out once instead of building a Series per row
+        date_values = df[actual_columns['date']].tolist()
+        amount_values = df[actual_columns['amount']].tolist()
+        if 'description' in actual_columns:
+            description_values = df[actual_columns['description']].tolist()
+        else:
+            description_values = [None] * len(df)
+        
+        # Undecoded cells would be stored as "b'...'" reprs
+        for values in (date_values, amount_values, description_values):
+            if any(isinstance(value, bytes) for value in values):
+                raise ValueError("CSV contains text that could not be decoded")
+        
         # Process each row
-        for _, row in df.iterrows():
+        for date_value, amount_value, desc_value in zip(date_values, amount_values, description_values):
             try:
                 # Parse date with Canadian formats
-                date_str = str(row[actual_columns['date']])
+                date_str = str(date_value)
                 try:
                     transaction_date = pd.to_datetime(date_str, dayfirst=True).to_pydatetime()
                 except:
-                    # Try different Canadian date formats
-                    for fmt in ['%d/%m/%Y', '%Y/%m/%d', '%d-%m-%Y', '%Y-%m-%d']:
-                        try:
-                            transaction_date = datetime.strptime(date_str, fmt)
-                            break
-                        except ValueError:
-                            continue
-                    else:
+                    # Try the Canadian date formats (one precompiled match, no strptime loop)
+                    try:
+                        transaction_date = parse_canadian_date_formats(date_str)
+                    except ValueError:
                         transaction_date = pd.to_datetime(date_str).to_pydatetime()
                 
                 # Parse amount
-                amount_value = row[actual_columns['amount']]
                 if pd.isna(amount_value):
                     continue
                 
-                # Handle string amounts
-                if isinstance(amount_value, str):
-                    amount_value = amount_value.replace('$', '').replace(',', '').strip()
-                    if amount_value.startswith('(') and amount_value.endswith(')'):
-                        amount_value = '-' + amount_value[1:-1]
-                
-                amount = float(amount_value)
+                amount = parse_amount(amount_value)
                 
                 # Get description
                 description = ""
-                if 'description' in actual_columns:
-                    desc_value = row[actual_columns['description']]
-                    if not pd.isna(desc_value):
-                        description = str(desc_value)[:200]
+                if desc_value is not None and not pd.isna(desc_value):
+                    description = str(desc_value)[:200]
                 
                 if not description:
                     description = "CSV Transaction"
@@ -238,7 +450,7 @@ def parse_csv_transactions(file_path: str) -> List[Dict[str, Any]]:
                 transactions.append({
                     'date': transaction_date,
                     'description': description,
-                    'amount': Decimal(str(amount))
+                    'amount': amount
                 })
             
             except (ValueError, TypeError, pd.errors.OutOfBoundsDatetime):
@@ -251,6 +463,86 @@ def parse_csv_transactions(file_path: str) -> List[Dict[str, Any]]:
 
 def parse_excel_transactions(file_path: str) -> List[Dict[str, Any]]:
     """Parse transactions from Excel file."""
+    try:
+        # Stream rows straight from the sheet XML; values_only skips Cell objects
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+    except InvalidFileException:
+        # Legacy .xls workbooks are not supported by openpyxl
+        return parse_legacy_excel_transactions(file_path)
+    except Exception as e:
+        raise ValueError(f"Error parsing Excel: {str(e)}")
+    
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        headers = next(rows, None) or ()
+        return parse_spreadsheet_rows(headers, rows)
+    
+    except Exception as e:
+        raise ValueError(f"Error parsing Excel: {str(e)}")
+    finally:
+        workbook.close()
+
+def parse_spreadsheet_rows(headers, rows) -> List[Dict[str, Any]]:
+    """Parse transactions from a header tuple and an iterator of row value tuples."""
+    transactions = []
+    
+    # Find actual column indexes
+    actual_columns = {}
+    for field, possible_names in SPREADSHEET_COLUMN_MAPPINGS.items():
+        for index, col_name in enumerate(headers):
+            if col_name in possible_names:
+                actual_columns[field] = index
+                break
+    
+    if 'date' not in actual_columns or 'amount' not in actual_columns:
+        raise ValueError("Required columns (date, amount) not found")
+    
+    date_index = actual_columns['date']
+    amount_index = actual_columns['amount']
+    description_index = actual_columns.get('description')
+    
+    # Process each row
+    for row in rows:
+        try:
+            # Parse date (openpyxl already returns datetimes for date cells)
+            date_value = row[date_index]
+            if isinstance(date_value, datetime):
+                transaction_date = date_value
+            elif pd:
+                transaction_date = pd.to_datetime(str(date_value)).to_pydatetime()
+            else:
+                transaction_date = parse_canadian_date_formats(str(date_value))
+            
+            # Parse amount
+            amount_value = row[amount_index]
+            if amount_value is None:
+                continue
+            
+            amount = parse_amount(amount_value)
+            
+            # Get description
+            description = ""
+            if description_index is not None:
+                desc_value = row[description_index]
+                if desc_value is not None:
+                    description = str(desc_value)[:200]
+            
+            if not description:
+                description = "Transaction"
+            
+            transactions.append({
+                'date': transaction_date,
+                'description': description,
+                'amount': amount
+            })
+        
+        except (ValueError, TypeError, IndexError, OverflowError):
+            continue  # Skip invalid rows
+    
+    return transactions
+
+def parse_legacy_excel_transactions(file_path: str) -> List[Dict[str, Any]]:
+    """Parse transactions from a legacy (.xls) Excel file via pandas."""
     if not pd:
         raise ValueError("Pandas not installed. Cannot parse Excel files.")
     
@@ -268,16 +560,9 @@ def parse_csv_transactions_from_dataframe(df) -> List[Dict[str, Any]]:
     """Helper function to parse transactions from a pandas DataFrame."""
     transactions = []
     
-    # Common column name mappings
-    column_mappings = {
-        'date': ['date', 'Date', 'DATE', 'transaction_date', 'Transaction Date'],
-        'description': ['description', 'Description', 'DESC', 'memo', 'Memo', 'details', 'Details'],
-        'amount': ['amount', 'Amount', 'AMOUNT', 'value', 'Value', 'transaction_amount', 'debit', 'credit']
-    }
-    
     # Find actual column names
     actual_columns = {}
-    for field, possible_names in column_mappings.items():
+    for field, possible_names in SPREADSHEET_COLUMN_MAPPINGS.items():
         for col_name in df.columns:
             if col_name in possible_names:
                 actual_columns[field] = col_name
@@ -298,13 +583,7 @@ def parse_csv_transactions_from_dataframe(df) -> List[Dict[str, Any]]:
             if pd.isna(amount_value):
                 continue
             
-            # Handle string amounts
-            if isinstance(amount_value, str):
-                amount_value = amount_value.replace('$', '').replace(',', '').strip()
-                if amount_value.startswith('(') and amount_value.endswith(')'):
-                    amount_value = '-' + amount_value[1:-1]
-            
-            amount = float(amount_value)
+            amount = parse_amount(amount_value)
             
             # Get description
             description = ""
@@ -319,7 +598,7 @@ def parse_csv_transactions_from_dataframe(df) -> List[Dict[str, Any]]:
             transactions.append({
                 'date': transaction_date,
                 'description': description,
-                'amount': Decimal(str(amount))
+                'amount': amount
             })
         
         except (ValueError, TypeError, pd.errors.OutOfBoundsDatetime):
@@ -327,67 +606,131 @@ def parse_csv_transactions_from_dataframe(df) -> List[Dict[str, Any]]:
     
     return transactions
 
+def matching_rule_categories(description_lower: str):
+    """Yield the rule category names whose keywords occur in the description, in rule order."""
+    if CATEGORY_KEYWORD_AUTOMATON is not None:
+        hits = {index for _, index in CATEGORY_KEYWORD_AUTOMATON.iter(description_lower)}
+        for index in sorted(hits):
+            yield CATEGORY_KEYWORDS[index][0]
+    else:
+        for category_name, keyword_pattern in CATEGORY_KEYWORD_PATTERNS:
+            if keyword_pattern.search(description_lower):
+                yield category_name
+
 def auto_categorize_transaction(description: str, amount: float, db: Session) -> int:
     """Auto-categorize transaction based on description and amount."""
     description_lower = description.lower()
     
-    # Define categorization rules
-    category_rules = {
-        'groceries': ['grocery', 'supermarket', 'food', 'loblaws', 'metro', 'sobeys', 'walmart'],
-        'food & dining': ['restaurant', 'coffee', 'tim hortons', 'starbucks', 'mcdonald', 'pizza', 'cafe'],
-        'transportation': ['gas station', 'petro', 'shell', 'esso', 'transit', 'uber', 'taxi', 'parking'],
-        'shopping': ['purchase', 'amazon', 'store', 'mall', 'shop'],
-        'bills & utilities': ['bank fee', 'service charge', 'utility', 'hydro', 'rogers', 'bell', 'telus'],
-        'entertainment': ['movie', 'entertainment', 'spotify', 'netflix', 'game'],
-        'healthcare': ['pharmacy', 'medical', 'hospital', 'dental', 'doctor'],
-        'travel': ['hotel', 'airline', 'flight', 'booking'],
-        'personal care': ['salon', 'spa', 'cosmetic'],
-        'education': ['school', 'university', 'course', 'tuition']
-    }
-    
     # Check for income patterns (positive amounts)
     if amount > 0:
-        income_keywords = ['salary', 'deposit', 'payment', 'refund', 'transfer', 'income']
-        if any(keyword in description_lower for keyword in income_keywords):
+        if INCOME_KEYWORD_PATTERN.search(description_lower):
             # For income, we don't categorize or create an "Income" category
             return None
     
-    # Find matching category
-    for category_name, keywords in category_rules.items():
-        if any(keyword in description_lower for keyword in keywords):
-            category = db.query(Category).filter(Category.name.ilike(f'%{category_name}%')).first()
-            if category:
-                return category.id
+    # Find matching category, resolved against the cached id -> name map
+    # (same case-insensitive substring test as name ILIKE '%rule%', lowest id
+    # first) instead of a SELECT per transaction
+    category_names = None
+    for category_name in matching_rule_categories(description_lower):
+        if category_names is None:
+            category_names = get_category_names(db)
+        category_id = min(
+            (cid for cid, name in category_names.items() if category_name in name.lower()),
+            default=None
+        )
+        if category_id is not None:
+            return category_id
     
     # Default to uncategorized
     return None
 
+def start_parse_pool() -> None:
+    """Start the statement-parsing worker processes.
+
+    Called from the app lifespan rather than at import so every API worker
+    owns a small, configurable pool. Workers are spawned, not forked, so they
+    never inherit the parent's engine connections, threads or locks.
+    """
+    global PARSE_POOL
+    PARSE_POOL = ProcessPoolExecutor(
+        max_workers=settings.parse_workers,
+        mp_context=get_context("spawn")
+    )
+
+def shutdown_parse_pool() -> None:
+    """Stop the statement-parsing worker processes."""
+    global PARSE_POOL
+    if PARSE_POOL is not None:
+        PARSE_POOL.shutdown(wait=False, cancel_futures=True)
+        PARSE_POOL = None
+
+def _parse_sync(file_path: str, file_ext: str) -> List[Dict[str, Any]]:
+    """Parse a statement file into transaction dicts (runs in a PARSE_POOL worker process)."""
+    if file_ext == '.pdf':
+        return parse_pdf_transactions(file_path)
+    elif file_ext == '.csv':
+        return parse_csv_transactions(file_path)
+    elif file_ext in ['.xlsx', '.xls']:
+        return parse_excel_transactions(file_path)
+    return []
+
+# Small LRU of parsed statements keyed by content hash. It lives in the API
+# process (not the workers), so re-uploads of the same file (e.g. UI retries)
+# skip the worker pool entirely. Only touched from the event loop thread.
+PARSED_STATEMENT_CACHE_SIZE = 32
+_parsed_statement_cache: "OrderedDict[Tuple[str, str], Tuple[Dict[str, Any], ...]]" = OrderedDict()
+
+async def parse_statement(file_path: str, file_ext: str, content_hash: str) -> List[Dict[str, Any]]:
+    """Parse a statement in the worker pool, reusing the result for repeat uploads."""
+    key = (content_hash, file_ext)
+    transactions = _parsed_statement_cache.get(key)
+    if transactions is not None:
+        _parsed_statement_cache.move_to_end(key)
+        return list(transactions)
+    
+    loop = asyncio.get_running_loop()
+    transactions = tuple(await loop.run_in_executor(PARSE_POOL, _parse_sync, file_path, file_ext))
+    _parsed_statement_cache[key] = transactions
+    if len(_parsed_statement_cache) > PARSED_STATEMENT_CACHE_SIZE:
+        _parsed_statement_cache.popitem(last=False)
+    return list(transactions)
+
 def store_transactions(transactions: List[Dict[str, Any]], user_id: int, file_id: int, db: Session):
     """Store parsed transactions in database with auto-categorization."""
+    rows = []
+    # Statements repeat merchants: categorize each distinct description (and
+    # credit/debit side, which only the income check looks at) once per batch
+    category_ids = {}
     for transaction_data in transactions:
         try:
             # Auto-categorize the transaction
-            category_id = auto_categorize_transaction(
-                transaction_data['description'], 
-                float(transaction_data['amount']), 
-                db
-            )
+            amount = float(transaction_data['amount'])
+            categorize_key = (transaction_data['description'], amount > 0)
+            if categorize_key not in category_ids:
+                category_ids[categorize_key] = auto_categorize_transaction(
+                    transaction_data['description'], 
+                    amount, 
+                    db
+                )
+            category_id = category_ids[categorize_key]
             
-            transaction = Transaction(
-                date=transaction_data['date'],
-                description=transaction_data['description'],
-                amount=transaction_data['amount'],
-                category_id=category_id,
-                user_id=user_id,
-                source_file_id=file_id
-            )
-            
-            db.add(transaction)
+            rows.append({
+                'date': transaction_data['date'],
+                'description': transaction_data['description'],
+                'amount': transaction_data['amount'],
+                'category_id': category_id,
+                'user_id': user_id,
+                'source_file_id': file_id
+            })
         
         except Exception:
             # Skip invalid transactions but continue processing
             continue
     
+    # Single Core executemany INSERT; nothing reads the rows back, so skip the
+    # ORM entirely (no mapper/unit-of-work overhead)
+    if rows:
+        db.execute(insert(Transaction.__table__), rows)
     db.commit()
 
 @router.post("/upload-statement")
@@ -396,7 +739,7 @@ async def upload_statement(
     request: Request,
     file: UploadFile = FastAPIFile(...),
     household_id: int = None,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Upload and parse bank statement file."""
@@ -404,6 +747,12 @@ async def upload_statement(
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file provided")
     
+    # Only members may attach uploads to a household
+    if household_id is not None and not await run_in_threadpool(
+        user_in_household, db, current_user.id, household_id
+    ):
+        raise HTTPException(status_code=403, detail="Not a member of this household")
+    
     # Sanitize filename
     safe_filename = sanitize_filename(file.filename)
     
@@ -414,59 +763,61 @@ async def upload_statement(
             detail="Unsupported file type. Please upload PDF, CSV, or Excel files."
         )
     
-    # Check file size
+    file_ext = os.path.splitext(safe_filename)[1].lower()
+    
+    # Stream the upload to a temp file in 1MB chunks, failing fast on oversize files
     max_size = settings.max_file_size  # 10MB default
-    content = await file.read()
-    if len(content) > max_size:
+    file_size = 0
+    content_hash = hashlib.blake2b(digest_size=16)
+    # The parser process needs a path, so use a named temp file that is removed
+    # automatically on close (no manual unlink, nothing left behind on errors)
+    temp_file = tempfile.NamedTemporaryFile(suffix=file_ext)
+    try:
+        while chunk := await file.read(1 << 20):
+            file_size += len(chunk)
+            if file_size > max_size:
+                break
+            content_hash.update(chunk)
+            # Blocking write syscall goes to the threadpool, not the event loop
+            await run_in_threadpool(temp_file.write, chunk)
+    except Exception:
+        temp_file.close()
+        raise
+    
+    if file_size > max_size:
+        temp_file.close()
         raise HTTPException(
             status_code=413, 
             detail=f"File too large. Maximum size is {max_size // (1024*1024)}MB"
         )
+    await run_in_threadpool(temp_file.flush)
     
-    # Create file record
+    # Create file record (sync Session work goes to the threadpool)
     db_file = File(
         filename=safe_filename,
-        file_size=len(content),
+        file_size=file_size,
         user_id=current_user.id,
         household_id=household_id,
         status=FileStatus.parsing
     )
-    
-    db.add(db_file)
-    db.commit()
-    db.refresh(db_file)
+    await run_in_threadpool(commit_instance, db, db_file)
     
     try:
-        # Save file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(safe_filename)[1]) as temp_file:
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-        
-        # Parse file based on type
-        file_ext = os.path.splitext(safe_filename.lower())[1]
-        transactions = []
-        
-        if file_ext == '.pdf':
-            transactions = parse_pdf_transactions(temp_file_path)
-        elif file_ext == '.csv':
-            transactions = parse_csv_transactions(temp_file_path)
-        elif file_ext in ['.xlsx', '.xls']:
-            transactions = parse_excel_transactions(temp_file_path)
-        
-        # Clean up temp file
-        os.unlink(temp_file_path)
+        # Parse file based on type. Parsing is CPU-bound, so run it in the worker
+        # process pool; uploads then parse in parallel across cores instead of
+        # serializing on this worker's GIL and event loop.
+        with temp_file:
+            transactions = await parse_statement(temp_file.name, file_ext, content_hash.hexdigest())
         
         if not transactions:
-            db_file.status = FileStatus.error
-            db.commit()
+            await run_in_threadpool(commit_instance, db, db_file, status=FileStatus.error)
             raise HTTPException(status_code=400, detail="No valid transactions found in file")
         
-        # Store transactions
-        store_transactions(transactions, current_user.id, db_file.id, db)
+        # Store transactions (sync SQLAlchemy work, so keep it off the event loop)
+        await run_in_threadpool(store_transactions, transactions, current_user.id, db_file.id, db)
         
         # Update file status
-        db_file.status = FileStatus.parsed
-        db.commit()
+        await run_in_threadpool(commit_instance, db, db_file, status=FileStatus.parsed)
         
         return {
             "message": f"Successfully processed {len(transactions)} transactions",
@@ -476,16 +827,11 @@ async def upload_statement(
         }
     
     except Exception as e:
-        # Clean up temp file if it exists
-        try:
-            if 'temp_file_path' in locals():
-                os.unlink(temp_file_path)
-        except:
-            pass
+        # Make sure the temp file is released
+        temp_file.close()
         
         # Update file status
-        db_file.status = FileStatus.error
-        db.commit()
+        await run_in_threadpool(commit_instance, db, db_file, status=FileStatus.error)
         
         raise HTTPException(
             status_code=500, 
@@ -494,28 +840,38 @@ async def upload_statement(
 
 @router.get("/files")
 def get_uploaded_files(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get user's uploaded files."""
-    files = db.query(File).filter(File.user_id == current_user.id).all()
+    # Count transactions in SQL instead of loading every Transaction per file
+    transaction_counts = db.query(
+        Transaction.source_file_id,
+        func.count(Transaction.id).label("count")
+    ).join(File, Transaction.source_file_id == File.id).filter(
+        File.user_id == current_user.id
+    ).group_by(Transaction.source_file_id).subquery()
+    
+    files = db.query(File, transaction_counts.c.count).outerjoin(
+        transaction_counts, transaction_counts.c.source_file_id == File.id
+    ).filter(File.user_id == current_user.id).yield_per(500)
     
     result = []
-    for file in files:
+    for file, transactions_count in files:
         result.append({
             "id": file.id,
             "filename": file.filename,
             "file_size": file.file_size,
             "status": file.status.value,
             "uploaded_at": file.uploaded_at,
-            "transactions_count": len(file.transactions) if file.transactions else 0
+            "transactions_count": transactions_count or 0
         })
     
     return result
 
 @router.post("/categorize-transactions")
 def categorize_existing_transactions(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Categorize existing uncategorized transactions."""
@@ -526,12 +882,17 @@ def categorize_existing_transactions(
     ).all()
     
     categorized_count = 0
+    category_ids = {}  # one categorization per distinct (description, credit/debit)
     for transaction in uncategorized_transactions:
-        category_id = auto_categorize_transaction(
-            transaction.description,
-            float(transaction.amount),
-            db
-        )
+        amount = float(transaction.amount)
+        categorize_key = (transaction.description, amount > 0)
+        if categorize_key not in category_ids:
+            category_ids[categorize_key] = auto_categorize_transaction(
+                transaction.description,
+                amount,
+                db
+            )
+        category_id = category_ids[categorize_key]
         
         if category_id:
             transaction.category_id = category_id
@@ -28,9 +28,9 @@ from decimal import Decimal
 import calendar
 
 from ..database import get_db
-from ..auth import get_current_user
+from ..auth import get_current_user, UserContext
 from ..models import (
-    User, Goal, GoalContribution, GoalCategory, GoalStatus, GoalPriority,
+    Goal, GoalContribution, GoalCategory, GoalStatus, GoalPriority,
     Transaction, Income
 )
 
@@ -116,7 +116,7 @@ def create_goal(
     category: Optional[str] = None,
     priority: Optional[str] = "medium",
     monthly_contribution: Optional[float] = 0,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Create a new financial goal with enhanced features."""
@@ -173,7 +173,7 @@ def get_goals(
     status: Optional[str] = Query(None, description="Filter by status: active, completed, paused"),
     category: Optional[str] = Query(None, description="Filter by category"),
     priority: Optional[str] = Query(None, description="Filter by priority"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get user's goals with filtering and progress calculations."""
@@ -206,7 +206,7 @@ def get_goals(
 
 @router.get("/summary")
 def get_goals_summary(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get summary statistics for all user's goals."""
@@ -259,7 +259,7 @@ def get_goals_summary(
 @router.get("/{goal_id}")
 def get_goal(
     goal_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get a specific goal with progress calculations."""
@@ -283,7 +283,7 @@ def update_goal(
     target_date: Optional[str] = None,
     category: Optional[str] = None,
     priority: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update a goal."""
@@ -335,7 +335,7 @@ def update_goal(
 @router.delete("/{goal_id}")
 def delete_goal(
     goal_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Delete a goal."""
@@ -357,7 +357,7 @@ def contribute_to_goal(
     goal_id: int,
     amount: float,
     notes: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Add a contribution to a goal."""
@@ -394,7 +394,7 @@ def contribute_to_goal(
 def update_goal_progress(
     goal_id: int,
     current_amount: float,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update goal progress manually."""
@@ -428,7 +428,7 @@ def update_goal_progress(
 
 @router.get("/analytics/category-breakdown")
 def get_goals_by_category(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get goals breakdown by category with analytics."""
@@ -470,7 +470,7 @@ def get_goals_by_category(
 
 @router.get("/analytics/monthly-projections")
 def get_monthly_projections(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get monthly projections for goal completion."""
@@ -511,7 +511,7 @@ def get_monthly_projections(
 @router.get("/analytics/contribution-history")
 def get_contribution_history(
     months: int = Query(12, description="Number of months to analyze"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get contribution history analytics."""
@@ -569,7 +569,7 @@ def get_contribution_history(
 
 @router.get("/recommendations")
 def get_goal_recommendations(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get personalized goal recommendations and optimization tips."""
@@ -652,7 +652,7 @@ def add_goal_contribution(
     goal_id: int,
     amount: float,
     notes: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Add a contribution to a goal with proper tracking."""
@@ -18,18 +18,19 @@ Features:
 
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case, and_
+from sqlalchemy import func, and_
 from typing import Optional, List
 from datetime import datetime, timedelta
 from decimal import Decimal
 
 from ..database import get_db
-from ..auth import get_current_user
+from ..auth import get_current_user, UserContext
 from ..schemas import (
     IncomeCreate, IncomeUpdate, IncomeResponse,
     FinancialSummary, ExpenseSummary, MonthlyTrend
 )
-from ..models import User, Income, Transaction, Category
+from ..models import Income, Transaction, Category
+from ..queries import TOTAL_EXPENSES, EXPENSE_COUNT
 
 # Create router
 router = APIRouter(prefix="/income", tags=["Income"])
@@ -41,7 +42,7 @@ def get_income(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     source: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get user's income records with optional filtering."""
@@ -73,7 +74,7 @@ def get_income(
 @router.post("", response_model=IncomeResponse)
 def create_income(
     income: IncomeCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Create a new income record."""
@@ -105,7 +106,7 @@ def create_income(
 @router.get("/{income_id}", response_model=IncomeResponse)
 def get_income_record(
     income_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get a specific income record."""
@@ -130,7 +131,7 @@ def get_income_record(
 def update_income(
     income_id: int,
     income_update: IncomeUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update an income record."""
@@ -166,7 +167,7 @@ def update_income(
 @router.delete("/{income_id}")
 def delete_income(
     income_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Delete an income record."""
@@ -187,7 +188,7 @@ def delete_income(
 def get_financial_summary(
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get financial summary for a date range."""
@@ -209,7 +210,7 @@ def get_financial_summary(
     
     # Get total expenses (negative transactions)
     total_expenses = db.query(
-        func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0))
+        TOTAL_EXPENSES
     ).filter(
         Transaction.user_id == current_user.id,
         Transaction.date >= start_dt,
@@ -230,7 +231,7 @@ def get_financial_summary(
 def get_expense_summary(
     start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get expense summary by category."""
@@ -247,8 +248,8 @@ def get_expense_summary(
     expense_summary = db.query(
         Category.name.label('category_name'),
         Category.id.label('category_id'),
-        func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0)).label('total_amount'),
-        func.count(case((Transaction.amount < 0, Transaction.id), else_=None)).label('transaction_count'),
+        TOTAL_EXPENSES.label('total_amount'),
+        EXPENSE_COUNT.label('transaction_count'),
         Category.default_budget.label('budget_amount')
     ).join(
         Transaction, Category.id == Transaction.category_id, isouter=True
@@ -260,7 +261,7 @@ def get_expense_summary(
     ).group_by(
         Category.id, Category.name, Category.default_budget
     ).order_by(
-        func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0)).desc()
+        TOTAL_EXPENSES.desc()
     ).all()
     
     result = []
@@ -283,7 +284,7 @@ def get_expense_summary(
 @router.get("/trends/monthly", response_model=List[MonthlyTrend])
 def get_monthly_trends(
     months: int = Query(12, description="Number of months to include"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get monthly income and expense trends."""
@@ -304,7 +305,7 @@ def get_monthly_trends(
     # Get monthly expenses
     monthly_expenses = db.query(
         func.strftime('%Y-%m', Transaction.date).label('month_year'),
-        func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0)).label('expenses')
+        TOTAL_EXPENSES.label('expenses')
     ).filter(
         Transaction.user_id == current_user.id,
         Transaction.date >= start_date
@@ -328,7 +329,7 @@ def get_monthly_trends(
         
         # Get expenses for this month
         expenses = db.query(
-            func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0))
+            TOTAL_EXPENSES
         ).filter(
             Transaction.user_id == current_user.id,
             func.strftime('%Y-%m', Transaction.date) == month_str
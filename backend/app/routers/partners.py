@@ -10,31 +10,34 @@ This module handles:
 """
 
 from fastapi import APIRouter, HTTPException, Depends, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func, case, and_, or_
+from sqlalchemy.orm import Session, joinedload, selectinload, contains_eager
+from sqlalchemy import func, and_, or_
 from typing import Optional, List
 from datetime import datetime, timedelta
 from decimal import Decimal
 
 from ..database import get_db
-from ..auth import get_current_user
+from ..auth import get_current_user, user_in_household, user_household_id, UserContext
 from ..models import (
     User, Transaction, Category, Goal, Income, 
     Household, HouseholdUser, SharedExpense, SharedExpenseSplit,
-    BankAccount, GoalContribution
+    BankAccount, GoalContribution, SplitMethod
 )
+from ..queries import TOTAL_EXPENSES
 
 # Create router
 router = APIRouter(prefix="/partners", tags=["Partners"])
 
 @router.get("/household-overview")
 def get_household_overview(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get household overview with all members' financial data."""
     # Get user's household
-    household_membership = db.query(HouseholdUser).filter(
+    household_membership = db.query(HouseholdUser).options(
+        joinedload(HouseholdUser.household)
+    ).filter(
         HouseholdUser.user_id == current_user.id
     ).first()
     
@@ -44,7 +47,9 @@ def get_household_overview(
     household = household_membership.household
     
     # Get all household members
-    members = db.query(HouseholdUser).join(User).filter(
+    members = db.query(HouseholdUser).join(User).options(
+        contains_eager(HouseholdUser.user)
+    ).filter(
         HouseholdUser.household_id == household.id
     ).all()
     
@@ -58,7 +63,7 @@ def get_household_overview(
         
         # Get member's spending (last 30 days)
         member_spending = db.query(
-            func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0))
+            TOTAL_EXPENSES
         ).filter(
             Transaction.user_id == user.id,
             Transaction.date >= datetime.now() - timedelta(days=30)
@@ -108,20 +113,20 @@ def get_household_overview(
 @router.get("/spending-comparison")
 def get_spending_comparison(
     months: int = Query(6, description="Number of months to analyze"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get spending comparison between household members over time."""
     # Get household members
-    household_membership = db.query(HouseholdUser).filter(
-        HouseholdUser.user_id == current_user.id
-    ).first()
+    household_id = user_household_id(db, current_user.id)
     
-    if not household_membership:
+    if household_id is None:
         raise HTTPException(status_code=404, detail="User not part of any household")
     
-    members = db.query(HouseholdUser).join(User).filter(
-        HouseholdUser.household_id == household_membership.household_id
+    members = db.query(HouseholdUser).join(User).options(
+        contains_eager(HouseholdUser.user)
+    ).filter(
+        HouseholdUser.household_id == household_id
     ).all()
     
     end_date = datetime.now()
@@ -146,7 +151,7 @@ def get_spending_comparison(
             
             # Get individual spending
             individual_spending = db.query(
-                func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0))
+                TOTAL_EXPENSES
             ).filter(
                 Transaction.user_id == user.id,
                 Transaction.date >= month_start,
@@ -164,7 +169,7 @@ def get_spending_comparison(
         shared_expenses = db.query(
             func.sum(SharedExpense.total_amount)
         ).filter(
-            SharedExpense.household_id == household_membership.household_id,
+            SharedExpense.household_id == household_id,
             SharedExpense.created_at >= month_start,
             SharedExpense.created_at <= month_end
         ).scalar() or 0
@@ -176,20 +181,20 @@ def get_spending_comparison(
 
 @router.get("/category-breakdown")
 def get_category_breakdown(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get detailed category breakdown for household members."""
     # Get household
-    household_membership = db.query(HouseholdUser).filter(
-        HouseholdUser.user_id == current_user.id
-    ).first()
+    household_id = user_household_id(db, current_user.id)
     
-    if not household_membership:
+    if household_id is None:
         raise HTTPException(status_code=404, detail="User not part of any household")
     
-    members = db.query(HouseholdUser).join(User).filter(
-        HouseholdUser.household_id == household_membership.household_id
+    members = db.query(HouseholdUser).join(User).options(
+        contains_eager(HouseholdUser.user)
+    ).filter(
+        HouseholdUser.household_id == household_id
     ).all()
     
     # Get last 30 days
@@ -213,7 +218,7 @@ def get_category_breakdown(
             
             # Get member's spending in this category
             member_spending = db.query(
-                func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0))
+                TOTAL_EXPENSES
             ).filter(
                 Transaction.user_id == user.id,
                 Transaction.category_id == category.id,
@@ -241,38 +246,33 @@ def get_category_breakdown(
 @router.get("/shared-expenses")
 def get_shared_expenses(
     limit: int = Query(50, description="Number of expenses to return"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get shared expenses for the household."""
     # Get household
-    household_membership = db.query(HouseholdUser).filter(
-        HouseholdUser.user_id == current_user.id
-    ).first()
+    household_id = user_household_id(db, current_user.id)
     
-    if not household_membership:
+    if household_id is None:
         raise HTTPException(status_code=404, detail="User not part of any household")
     
     # Get shared expenses with details
-    shared_expenses = db.query(SharedExpense).join(Transaction).join(User).filter(
-        SharedExpense.household_id == household_membership.household_id
+    shared_expenses = db.query(SharedExpense).join(Transaction).join(User).options(
+        contains_eager(SharedExpense.transaction).selectinload(Transaction.category),
+        selectinload(SharedExpense.paid_by),
+        selectinload(SharedExpense.splits).selectinload(SharedExpenseSplit.user)
+    ).filter(
+        SharedExpense.household_id == household_id
     ).order_by(SharedExpense.created_at.desc()).limit(limit).all()
     
     result = []
     for expense in shared_expenses:
-        # Get splits
-        splits = db.query(SharedExpenseSplit).join(User).filter(
-            SharedExpenseSplit.shared_expense_id == expense.id
-        ).all()
+        # Splits (with their users) are eager-loaded above
+        splits = [split for split in expense.splits if split.user is not None]
         
         # Get category name if available
-        category_name = None
-        if expense.transaction.category_id:
-            category = db.query(Category).filter(
-                Category.id == expense.transaction.category_id
-            ).first()
-            if category:
-                category_name = category.name
+        category = expense.transaction.category
+        category_name = category.name if category else None
         
         result.append({
             "id": expense.id,
@@ -284,13 +284,13 @@ def get_shared_expenses(
                 "name": expense.paid_by.name
             },
             "category": category_name or "Uncategorized",
-            "split_method": expense.split_method,
+            "split_method": expense.split_method.value if expense.split_method else None,
             "splits": [
                 {
                     "user_id": split.user.id,
                     "user_name": split.user.name,
                     "amount": float(split.amount),
-                    "is_paid": split.is_paid
+                    "is_paid": split.is_paid.value if split.is_paid else None
                 }
                 for split in splits
             ]
@@ -300,26 +300,26 @@ def get_shared_expenses(
 
 @router.get("/joint-goals")
 def get_joint_goals(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get joint savings goals for household members."""
     # Get household
-    household_membership = db.query(HouseholdUser).filter(
-        HouseholdUser.user_id == current_user.id
-    ).first()
+    household_id = user_household_id(db, current_user.id)
     
-    if not household_membership:
+    if household_id is None:
         raise HTTPException(status_code=404, detail="User not part of any household")
     
-    members = db.query(HouseholdUser).join(User).filter(
-        HouseholdUser.household_id == household_membership.household_id
+    members = db.query(HouseholdUser).join(User).options(
+        contains_eager(HouseholdUser.user)
+    ).filter(
+        HouseholdUser.household_id == household_id
     ).all()
     
     member_ids = [member.user_id for member in members]
     
     # Get goals from all household members (could be joint goals or individual goals we want to show)
-    goals = db.query(Goal).filter(
+    goals = db.query(Goal).options(selectinload(Goal.user)).filter(
         Goal.user_id.in_(member_ids),
         Goal.status == 'active'
     ).all()
@@ -327,7 +327,9 @@ def get_joint_goals(
     joint_goals = []
     for goal in goals:
         # Get contributions from all household members
-        contributions = db.query(GoalContribution).join(User).filter(
+        contributions = db.query(GoalContribution).join(User).options(
+            contains_eager(GoalContribution.user)
+        ).filter(
             GoalContribution.goal_id == goal.id,
             GoalContribution.user_id.in_(member_ids)
         ).all()
@@ -365,16 +367,23 @@ def create_shared_expense(
     transaction_id: int,
     split_method: str = "equal",
     splits: Optional[List[dict]] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Create a shared expense from an existing transaction."""
+    # Validate split method
+    try:
+        method = SplitMethod(split_method)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid split method. Must be one of: {', '.join(m.value for m in SplitMethod)}"
+        )
+    
     # Get household
-    household_membership = db.query(HouseholdUser).filter(
-        HouseholdUser.user_id == current_user.id
-    ).first()
+    household_id = user_household_id(db, current_user.id)
     
-    if not household_membership:
+    if household_id is None:
         raise HTTPException(status_code=404, detail="User not part of any household")
     
     # Get transaction
@@ -388,11 +397,11 @@ def create_shared_expense(
     
     # Create shared expense
     shared_expense = SharedExpense(
-        household_id=household_membership.household_id,
+        household_id=household_id,
         transaction_id=transaction_id,
         paid_by_user_id=current_user.id,
         total_amount=abs(transaction.amount),
-        split_method=split_method
+        split_method=method
     )
     
     db.add(shared_expense)
@@ -400,10 +409,10 @@ def create_shared_expense(
     db.refresh(shared_expense)
     
     # Create splits
-    if split_method == "equal" and not splits:
+    if method == SplitMethod.equal and not splits:
         # Equal split among all household members
         members = db.query(HouseholdUser).filter(
-            HouseholdUser.household_id == household_membership.household_id
+            HouseholdUser.household_id == household_id
         ).all()
         
         amount_per_person = abs(transaction.amount) / len(members)
@@ -436,7 +445,7 @@ def create_shared_expense(
 def invite_partner(
     email: str,
     role: str = "member",
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Invite a partner to join the household."""
@@ -458,12 +467,7 @@ def invite_partner(
         raise HTTPException(status_code=404, detail="User not found. They need to register first.")
     
     # Check if already a member
-    existing_membership = db.query(HouseholdUser).filter(
-        HouseholdUser.household_id == household_membership.household_id,
-        HouseholdUser.user_id == invited_user.id
-    ).first()
-    
-    if existing_membership:
+    if user_in_household(db, invited_user.id, household_membership.household_id):
         raise HTTPException(status_code=400, detail="User is already a household member")
     
     # Create membership
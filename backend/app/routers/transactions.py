@@ -18,21 +18,43 @@ Features:
 
 from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, String, func, case
+from sqlalchemy import and_, or_, String, func
 from typing import Optional, List
 from datetime import datetime, timedelta
 
 from ..database import get_db
-from ..auth import get_current_user
+from ..auth import get_current_user, UserContext
+from ..cache import get_category_names
 from ..schemas import (
     TransactionCreate, TransactionUpdate, TransactionResponse, 
     CategorizeTransactionRequest
 )
-from ..models import User, Transaction, Category
+from ..models import Transaction, Category
+from ..queries import TOTAL_EXPENSES
 
 # Create router
 router = APIRouter(prefix="/transactions", tags=["Transactions"])
 
+# Column projection for list endpoints: plain rows skip ORM hydration,
+# identity-map registration and the eager relationship loads of Transaction
+TRANSACTION_LIST_COLUMNS = (
+    Transaction.id,
+    Transaction.date,
+    Transaction.description,
+    Transaction.amount,
+    Transaction.category_id,
+    Transaction.account_id,
+    Transaction.user_id,
+    Transaction.source_file_id,
+    Category.name.label('category_name'),
+)
+
+def transaction_row_to_dict(row) -> dict:
+    """Convert a TRANSACTION_LIST_COLUMNS row to the response dict."""
+    data = row._asdict()
+    data["amount"] = float(row.amount)
+    return data
+
 @router.get("", response_model=List[TransactionResponse])
 def get_transactions(
     skip: int = 0,
@@ -41,11 +63,13 @@ def get_transactions(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     search: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get user's transactions with optional filtering."""
-    query = db.query(Transaction).filter(Transaction.user_id == current_user.id)
+    query = db.query(*TRANSACTION_LIST_COLUMNS).outerjoin(
+        Category, Transaction.category_id == Category.id
+    ).filter(Transaction.user_id == current_user.id)
     
     # Apply filters
     if category_id:
@@ -63,35 +87,14 @@ def get_transactions(
         query = query.filter(Transaction.description.contains(search))
     
     # Get transactions with category names
-    transactions = query.order_by(Transaction.date.desc()).offset(skip).limit(limit).all()
+    rows = query.order_by(Transaction.date.desc()).offset(skip).limit(limit).all()
     
-    # Convert to response format with category names
-    result = []
-    for transaction in transactions:
-        category_name = None
-        if transaction.category_id:
-            category = db.query(Category).filter(Category.id == transaction.category_id).first()
-            if category:
-                category_name = category.name
-        
-        result.append({
-            "id": transaction.id,
-            "date": transaction.date,
-            "description": transaction.description,
-            "amount": float(transaction.amount),
-            "category_id": transaction.category_id,
-            "account_id": transaction.account_id,
-            "user_id": transaction.user_id,
-            "source_file_id": transaction.source_file_id,
-            "category_name": category_name
-        })
-    
-    return result
+    return [transaction_row_to_dict(row) for row in rows]
 
 @router.post("", response_model=TransactionResponse)
 def create_transaction(
     transaction: TransactionCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Create a new transaction."""
@@ -115,11 +118,7 @@ def create_transaction(
     db.refresh(db_transaction)
     
     # Get category name for response
-    category_name = None
-    if db_transaction.category_id:
-        category = db.query(Category).filter(Category.id == db_transaction.category_id).first()
-        if category:
-            category_name = category.name
+    category_name = get_category_names(db, (db_transaction.category_id,)).get(db_transaction.category_id)
     
     return {
         "id": db_transaction.id,
@@ -135,7 +134,7 @@ def create_transaction(
 
 @router.get("/statistics")
 def get_transaction_statistics(
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get comprehensive transaction statistics."""
@@ -172,7 +171,7 @@ def get_transaction_statistics(
     top_categories = db.query(
         Category.name,
         func.count(Transaction.id).label('count'),
-        func.sum(case((Transaction.amount < 0, Transaction.amount * -1), else_=0)).label('total_spent')
+        TOTAL_EXPENSES.label('total_spent')
     ).join(Transaction).filter(
         Transaction.user_id == current_user.id
     ).group_by(Category.id, Category.name).order_by(
@@ -219,7 +218,7 @@ def get_transaction_statistics(
 @router.get("/{transaction_id}", response_model=TransactionResponse)
 def get_transaction(
     transaction_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Get a specific transaction."""
@@ -232,11 +231,7 @@ def get_transaction(
         raise HTTPException(status_code=404, detail="Transaction not found")
     
     # Get category name
-    category_name = None
-    if transaction.category_id:
-        category = db.query(Category).filter(Category.id == transaction.category_id).first()
-        if category:
-            category_name = category.name
+    category_name = get_category_names(db, (transaction.category_id,)).get(transaction.category_id)
     
     return {
         "id": transaction.id,
@@ -254,7 +249,7 @@ def get_transaction(
 def update_transaction(
     transaction_id: int,
     transaction_update: TransactionUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update a transaction."""
@@ -281,11 +276,7 @@ def update_transaction(
     db.refresh(transaction)
     
     # Get category name
-    category_name = None
-    if transaction.category_id:
-        category = db.query(Category).filter(Category.id == transaction.category_id).first()
-        if category:
-            category_name = category.name
+    category_name = get_category_names(db, (transaction.category_id,)).get(transaction.category_id)
     
     return {
         "id": transaction.id,
@@ -302,7 +293,7 @@ def update_transaction(
 @router.delete("/{transaction_id}")
 def delete_transaction(
     transaction_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Delete a transaction."""
@@ -322,7 +313,7 @@ def delete_transaction(
 @router.post("/categorize")
 def categorize_transactions(
     request: CategorizeTransactionRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Manually categorize multiple transactions."""
@@ -355,7 +346,7 @@ def categorize_transactions(
 @router.post("/bulk-delete")
 def bulk_delete_transactions(
     transaction_ids: List[int],
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Delete multiple transactions at once."""
@@ -387,7 +378,7 @@ def bulk_delete_transactions(
 @router.post("/bulk-update")
 def bulk_update_transactions(
     updates: List[dict],  # List of {"id": int, "category_id": int, "description": str, etc.}
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Update multiple transactions at once."""
@@ -431,7 +422,7 @@ def bulk_update_transactions(
 def search_transactions(
     query: str = Query(..., description="Search query"),
     limit: int = Query(50, description="Maximum number of results"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Search transactions by description, amount, or category."""
@@ -439,7 +430,7 @@ def search_transactions(
         raise HTTPException(status_code=400, detail="Query must be at least 2 characters")
     
     # Search in description
-    transactions = db.query(Transaction).join(Category, Transaction.category_id == Category.id, isouter=True).filter(
+    rows = db.query(*TRANSACTION_LIST_COLUMNS).join(Category, Transaction.category_id == Category.id, isouter=True).filter(
         Transaction.user_id == current_user.id,
         or_(
             Transaction.description.ilike(f"%{query}%"),
@@ -448,25 +439,7 @@ def search_transactions(
         )
     ).order_by(Transaction.date.desc()).limit(limit).all()
     
-    result = []
-    for transaction in transactions:
-        category_name = None
-        if transaction.category_id:
-            category = db.query(Category).filter(Category.id == transaction.category_id).first()
-            if category:
-                category_name = category.name
-        
-        result.append({
-            "id": transaction.id,
-            "date": transaction.date,
-            "description": transaction.description,
-            "amount": float(transaction.amount),
-            "category_id": transaction.category_id,
-            "account_id": transaction.account_id,
-            "user_id": transaction.user_id,
-            "source_file_id": transaction.source_file_id,
-            "category_name": category_name
-        })
+    result = [transaction_row_to_dict(row) for row in rows]
     
     return {
         "query": query,
@@ -480,11 +453,19 @@ def export_transactions(
     end_date: Optional[str] = None,
     category_id: Optional[int] = None,
     format: str = Query("csv", description="Export format: csv or json"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserContext = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Export transactions in various formats."""
-    query = db.query(Transaction).filter(Transaction.user_id == current_user.id)
+    query = db.query(
+        Transaction.date,
+        Transaction.description,
+        Transaction.amount,
+        Transaction.account_id,
+        Category.name.label('category_name')
+    ).outerjoin(
+        Category, Transaction.category_id == Category.id
+    ).filter(Transaction.user_id == current_user.id)
     
     # Apply filters
     if start_date:
@@ -498,24 +479,19 @@ def export_transactions(
     if category_id:
         query = query.filter(Transaction.category_id == category_id)
     
-    transactions = query.order_by(Transaction.date.desc()).all()
+    rows = query.order_by(Transaction.date.desc()).all()
     
     # Prepare data
-    export_data = []
-    for transaction in transactions:
-        category_name = None
-        if transaction.category_id:
-            category = db.query(Category).filter(Category.id == transaction.category_id).first()
-            if category:
-                category_name = category.name
-        
-        export_data.append({
-            "date": transaction.date.strftime('%Y-%m-%d'),
-            "description": transaction.description,
-            "amount": float(transaction.amount),
-            "category": category_name or "Uncategorized",
-            "account_id": transaction.account_id
-        })
+    export_data = [
+        {
+            "date": row.date.strftime('%Y-%m-%d'),
+            "description": row.description,
+            "amount": float(row.amount),
+            "category": row.category_name or "Uncategorized",
+            "account_id": row.account_id
+        }
+        for row in rows
+    ]
     
     if format.lower() == "csv":
         import csv
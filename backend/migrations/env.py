@@ -0,0 +1,60 @@
+"""Alembic environment: runs migrations against the app's configured database."""
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+
+from app.config import settings
+from app.models import Base
+
+config = context.config
+
+# Only configure logging when run from the CLI (alembic.ini), never when the
+# app stamps a new database from inside its own process
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# Same DATABASE_URL as the app ('%' escaped for ConfigParser interpolation)
+config.set_main_option("sqlalchemy.url", settings.database_url.replace("%", "%%"))
+
+target_metadata = Base.metadata
+
+def configure_context(**kwargs):
+    """Configure the migration context; SQLite needs batch mode for ALTERs."""
+    context.configure(
+        target_metadata=target_metadata,
+        render_as_batch=settings.database_url.startswith("sqlite"),
+        compare_type=True,
+        **kwargs
+    )
+
+def run_migrations_offline():
+    """Emit the migration SQL to stdout without a database connection."""
+    configure_context(url=config.get_main_option("sqlalchemy.url"), literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online():
+    """Run migrations on a connection (the caller's, if one was passed in)."""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        configure_context(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+    
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+        future=True
+    )
+    with connectable.connect() as connection:
+        configure_context(connection=connection)
+        with context.begin_transaction():
+            context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
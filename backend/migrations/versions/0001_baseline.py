@@ -0,0 +1,23 @@
+"""Baseline: the schema create_all built before migrations existed
+
+Databases created by earlier releases already have these tables; mark them
+with ``alembic stamp 0001`` and then ``alembic upgrade head``.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+"""
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    pass
+
+
+def downgrade():
+    pass
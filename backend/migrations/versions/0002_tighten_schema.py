@@ -0,0 +1,256 @@
+"""Bring a baseline schema up to the current models
+
+Bounded String/Numeric types, native enums for the former free-text status
+columns, NOT NULL and CHECK constraints, the reworked indexes, and (on
+PostgreSQL) JSONB tags with a GIN index plus the transaction_monthly view.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+MONEY = sa.Numeric(12, 2)
+
+# (table, column, baseline type, current type)
+COLUMN_TYPES = (
+    ('users', 'name', sa.String(), sa.String(255)),
+    ('users', 'email', sa.String(), sa.String(255)),
+    ('households', 'name', sa.String(), sa.String(255)),
+    ('accounts', 'name', sa.String(), sa.String(255)),
+    ('accounts', 'last4', sa.String(), sa.String(4)),
+    ('accounts', 'currency', sa.String(), sa.String(3)),
+    ('transactions', 'amount', sa.Numeric(), MONEY),
+    ('categories', 'name', sa.String(), sa.String(255)),
+    ('categories', 'default_budget', sa.Numeric(), MONEY),
+    ('incomes', 'amount', sa.Numeric(), MONEY),
+    ('goals', 'name', sa.String(), sa.String(255)),
+    ('goals', 'target_amount', sa.Numeric(), MONEY),
+    ('goals', 'current_amount', sa.Numeric(), MONEY),
+    ('goals', 'monthly_contribution', sa.Numeric(), MONEY),
+    ('goal_contributions', 'amount', sa.Numeric(), MONEY),
+    ('bank_accounts', 'bank_name', sa.String(), sa.String(255)),
+    ('bank_accounts', 'account_number_last4', sa.String(), sa.String(4)),
+    ('bank_accounts', 'balance', sa.Numeric(), MONEY),
+    ('bank_accounts', 'currency', sa.String(), sa.String(3)),
+    ('shared_expenses', 'total_amount', sa.Numeric(), MONEY),
+    ('shared_expense_splits', 'amount', sa.Numeric(), MONEY),
+    ('shared_expense_splits', 'percentage', sa.Numeric(), sa.Numeric(5, 2)),
+    ('files', 'bank_name', sa.String(), sa.String(255)),
+)
+
+# Free-text columns that became native enums: (table, column, type name, values)
+ENUM_COLUMNS = (
+    ('transactions', 'is_recurring', 'recurrencetype', ('no', 'weekly', 'monthly', 'yearly')),
+    ('bank_accounts', 'account_type', 'accountkind', ('Checking', 'Savings', 'Credit Card', 'Investment', 'Loan')),
+    ('bank_accounts', 'is_active', 'bankaccountstatus', ('active', 'inactive', 'error')),
+    ('shared_expenses', 'split_method', 'splitmethod', ('equal', 'percentage', 'amount')),
+    ('shared_expense_splits', 'is_paid', 'paidstatus', ('pending', 'paid')),
+)
+
+# (table, column) pairs that are now NOT NULL
+NOT_NULL_COLUMNS = (
+    ('transactions', 'date'),
+    ('transactions', 'amount'),
+    ('transactions', 'user_id'),
+    ('transactions', 'is_recurring'),
+    ('goals', 'user_id'),
+    ('goals', 'target_amount'),
+    ('bank_accounts', 'user_id'),
+)
+
+# (table, name, condition)
+CHECK_CONSTRAINTS = (
+    ('accounts', 'ck_accounts_currency_iso', "currency IS NULL OR (length(currency) = 3 AND currency = upper(currency))"),
+    ('goals', 'ck_goals_target_amount_positive', 'target_amount > 0'),
+)
+
+# Baseline indexes the new composite indexes make redundant: (name, table, columns)
+DROPPED_INDEXES = (
+    ('ix_transactions_user_id', 'transactions', ['user_id']),
+    ('ix_transactions_user_category', 'transactions', ['user_id', 'category_id']),
+    ('ix_transactions_bank_account', 'transactions', ['bank_account_id']),
+    ('ix_incomes_user_id', 'incomes', ['user_id']),
+)
+
+# Baseline indexes rebuilt as covering indexes on PostgreSQL: (name, table, columns)
+COVERING_INDEXES = (
+    ('ix_transactions_user_date', 'transactions', ['user_id', 'date']),
+    ('ix_incomes_user_date', 'incomes', ['user_id', 'date']),
+)
+
+
+def is_postgresql():
+    """Whether the migration is running against PostgreSQL."""
+    return op.get_context().dialect.name == 'postgresql'
+
+
+def enum_type(name, values):
+    """Enum column type matching models.db_enum (native on PostgreSQL)."""
+    return sa.Enum(*values, name=name, native_enum=True)
+
+
+def create_indexes():
+    """Create the indexes the baseline schema did not have."""
+    op.create_index('ix_transactions_source_file_date', 'transactions', ['source_file_id', 'date'])
+    op.create_index('ix_transactions_bank_account_date', 'transactions', ['bank_account_id', sa.text('date DESC')])
+    op.create_index('ix_transactions_user_category_date', 'transactions', ['user_id', 'category_id', 'date'])
+    op.create_index(
+        'ix_transactions_recurring', 'transactions', ['is_recurring'],
+        postgresql_where=sa.text("is_recurring <> 'no'"),
+        sqlite_where=sa.text("is_recurring <> 'no'"),
+    )
+    op.create_index('ix_household_users_user_household', 'household_users', ['user_id', 'household_id'])
+    op.create_index('ix_goal_contributions_goal_date', 'goal_contributions', ['goal_id', sa.text('date DESC')])
+    op.create_index('ix_files_user_uploaded', 'files', ['user_id', 'uploaded_at'])
+
+
+def drop_indexes():
+    """Drop the indexes create_indexes() added."""
+    op.drop_index('ix_files_user_uploaded', table_name='files')
+    op.drop_index('ix_goal_contributions_goal_date', table_name='goal_contributions')
+    op.drop_index('ix_household_users_user_household', table_name='household_users')
+    op.drop_index('ix_transactions_recurring', table_name='transactions')
+    op.drop_index('ix_transactions_user_category_date', table_name='transactions')
+    op.drop_index('ix_transactions_bank_account_date', table_name='transactions')
+    op.drop_index('ix_transactions_source_file_date', table_name='transactions')
+
+
+def upgrade():
+    postgresql_db = is_postgresql()
+    
+    # Rows that would violate the new constraints are normalized first
+    op.execute("UPDATE transactions SET is_recurring = 'no' WHERE is_recurring IS NULL")
+    op.execute("UPDATE accounts SET currency = upper(currency) WHERE currency IS NOT NULL")
+    
+    for name, table, _columns in DROPPED_INDEXES + COVERING_INDEXES:
+        op.drop_index(name, table_name=table)
+    
+    if postgresql_db:
+        for _table, _column, type_name, values in ENUM_COLUMNS:
+            postgresql.ENUM(*values, name=type_name).create(op.get_bind(), checkfirst=True)
+    
+    tables = dict.fromkeys(
+        table for table, *_rest in COLUMN_TYPES + ENUM_COLUMNS + NOT_NULL_COLUMNS + CHECK_CONSTRAINTS
+    )
+    for table in tables:
+        with op.batch_alter_table(table) as batch_op:
+            for type_table, column, old_type, new_type in COLUMN_TYPES:
+                if type_table == table:
+                    batch_op.alter_column(column, existing_type=old_type, type_=new_type)
+            for enum_table, column, type_name, values in ENUM_COLUMNS:
+                if enum_table == table:
+                    batch_op.alter_column(
+                        column,
+                        existing_type=sa.String(),
+                        type_=enum_type(type_name, values),
+                        postgresql_using=f"{column}::{type_name}"
+                    )
+            for null_table, column in NOT_NULL_COLUMNS:
+                if null_table == table:
+                    batch_op.alter_column(column, nullable=False)
+            for check_table, name, condition in CHECK_CONSTRAINTS:
+                if check_table == table:
+                    batch_op.create_check_constraint(name, condition)
+    
+    with op.batch_alter_table('bank_accounts') as batch_op:
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), server_default=sa.func.now())
+    
+    with op.batch_alter_table('transactions') as batch_op:
+        if postgresql_db:
+            batch_op.alter_column(
+                'tags',
+                existing_type=sa.JSON(),
+                type_=postgresql.JSONB(),
+                postgresql_using='tags::jsonb',
+                server_default='[]'
+            )
+        else:
+            batch_op.alter_column('tags', existing_type=sa.JSON(), server_default='[]')
+    
+    for name, table, columns in COVERING_INDEXES:
+        op.create_index(name, table, columns, postgresql_include=['amount'])
+    create_indexes()
+    
+    if postgresql_db:
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_transactions_tags "
+            "ON transactions USING gin (tags jsonb_path_ops)"
+        )
+        op.execute(
+            "CREATE MATERIALIZED VIEW IF NOT EXISTS transaction_monthly AS "
+            "SELECT user_id, COALESCE(category_id, 0) AS category_id, "
+            "date_trunc('month', date) AS month, "
+            "SUM(CASE WHEN amount < 0 THEN -amount ELSE 0 END) AS total_spending, "
+            "COUNT(*) FILTER (WHERE amount < 0) AS transaction_count "
+            "FROM transactions GROUP BY 1, 2, 3 WITH DATA"
+        )
+        op.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_transaction_monthly_user_month_category "
+            "ON transaction_monthly (user_id, month, category_id)"
+        )
+
+
+def downgrade():
+    postgresql_db = is_postgresql()
+    
+    if postgresql_db:
+        op.execute("DROP MATERIALIZED VIEW IF EXISTS transaction_monthly")
+        op.execute("DROP INDEX IF EXISTS ix_transactions_tags")
+    
+    drop_indexes()
+    for name, table, _columns in COVERING_INDEXES:
+        op.drop_index(name, table_name=table)
+    
+    with op.batch_alter_table('transactions') as batch_op:
+        if postgresql_db:
+            batch_op.alter_column(
+                'tags',
+                existing_type=postgresql.JSONB(),
+                type_=sa.JSON(),
+                postgresql_using='tags::json',
+                server_default=None
+            )
+        else:
+            batch_op.alter_column('tags', existing_type=sa.JSON(), server_default=None)
+    
+    with op.batch_alter_table('bank_accounts') as batch_op:
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(), server_default=None)
+    
+    tables = dict.fromkeys(
+        table for table, *_rest in COLUMN_TYPES + ENUM_COLUMNS + NOT_NULL_COLUMNS + CHECK_CONSTRAINTS
+    )
+    for table in tables:
+        with op.batch_alter_table(table) as batch_op:
+            for check_table, name, _condition in CHECK_CONSTRAINTS:
+                if check_table == table:
+                    batch_op.drop_constraint(name, type_='check')
+            for null_table, column in NOT_NULL_COLUMNS:
+                if null_table == table:
+                    batch_op.alter_column(column, nullable=True)
+            for enum_table, column, type_name, values in ENUM_COLUMNS:
+                if enum_table == table:
+                    batch_op.alter_column(
+                        column,
+                        existing_type=enum_type(type_name, values),
+                        type_=sa.String(),
+                        postgresql_using=f"{column}::text"
+                    )
+            for type_table, column, old_type, new_type in COLUMN_TYPES:
+                if type_table == table:
+                    batch_op.alter_column(column, existing_type=new_type, type_=old_type)
+    
+    if postgresql_db:
+        for _table, _column, type_name, values in ENUM_COLUMNS:
+            postgresql.ENUM(*values, name=type_name).drop(op.get_bind(), checkfirst=True)
+    
+    for name, table, columns in DROPPED_INDEXES + COVERING_INDEXES:
+        op.create_index(name, table, columns)
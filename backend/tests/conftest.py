@@ -0,0 +1,32 @@
+"""Shared fixtures: an isolated in-memory SQLite database per test."""
+import os
+
+# Point the app at an in-memory database before any app module is imported
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base
+from app.cache import invalidate_category_names
+
+@pytest.fixture
+def db():
+    """Session on a fresh in-memory database with the full schema."""
+    engine = create_engine(
+        "sqlite://",
+        future=True,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, autoflush=False, future=True)()
+    invalidate_category_names()
+    try:
+        yield session
+    finally:
+        session.close()
+        invalidate_category_names()
+        engine.dispose()
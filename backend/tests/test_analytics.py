@@ -0,0 +1,15 @@
+"""Tests for the analytics helpers."""
+from datetime import datetime
+
+import pytest
+
+from app.routers.analytics import month_bounds
+
+@pytest.mark.parametrize("year, month, start, end", [
+    (2025, 1, datetime(2025, 1, 1), datetime(2025, 2, 1)),
+    (2024, 2, datetime(2024, 2, 1), datetime(2024, 3, 1)),
+    (2024, 11, datetime(2024, 11, 1), datetime(2024, 12, 1)),
+    (2024, 12, datetime(2024, 12, 1), datetime(2025, 1, 1)),
+])
+def test_month_bounds(year, month, start, end):
+    assert month_bounds(year, month) == (start, end)
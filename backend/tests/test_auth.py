@@ -0,0 +1,19 @@
+"""Tests for the auth helpers."""
+from app.auth import user_household_id, user_in_household
+from app.enums import Role
+from app.models import Household, HouseholdUser, User
+
+def test_user_in_household(db):
+    alice = User(name="Alice", email="alice@example.com")
+    bob = User(name="Bob", email="bob@example.com")
+    home, other = Household(name="Home"), Household(name="Other")
+    db.add_all([alice, bob, home, other])
+    db.flush()
+    db.add(HouseholdUser(household_id=home.id, user_id=alice.id, role=Role.owner))
+    db.commit()
+    
+    assert user_in_household(db, alice.id, home.id) is True
+    assert user_in_household(db, alice.id, other.id) is False
+    assert user_in_household(db, bob.id, home.id) is False
+    assert user_household_id(db, alice.id) == home.id
+    assert user_household_id(db, bob.id) is None
@@ -0,0 +1,42 @@
+"""Tests for the process-local category name cache."""
+from sqlalchemy import insert
+
+from app.auth import UserContext
+from app.cache import get_category_names
+from app.models import Category
+from app.routers.categories import get_categories, get_default_categories
+
+def test_orm_writes_invalidate_category_names(db):
+    assert get_category_names(db) == {}
+    
+    groceries = Category(name="Groceries")
+    db.add(groceries)
+    db.commit()
+    assert get_category_names(db) == {groceries.id: "Groceries"}
+    
+    groceries.name = "Food"
+    db.commit()
+    assert get_category_names(db) == {groceries.id: "Food"}
+    
+    db.delete(groceries)
+    db.commit()
+    assert get_category_names(db) == {}
+
+def test_missing_id_reloads_category_names(db):
+    assert get_category_names(db) == {}
+    
+    # Core insert: no mapper events, so the cached map is now stale
+    category_id = db.execute(insert(Category.__table__).values(name="Travel")).inserted_primary_key[0]
+    db.commit()
+    assert get_category_names(db) == {}
+    assert get_category_names(db, (category_id,)) == {category_id: "Travel"}
+
+def test_default_category_seed_invalidates_category_names(db):
+    assert get_category_names(db) == {}
+    
+    user = UserContext(id=1, name="Alice", email="alice@example.com", created_at=None)
+    seeded = get_categories(current_user=user, db=db)
+    
+    names = get_category_names(db)
+    assert sorted(names.values()) == sorted(c["name"] for c in get_default_categories())
+    assert {c["id"] for c in seeded} == set(names)
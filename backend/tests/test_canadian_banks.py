@@ -0,0 +1,36 @@
+"""Tests for the Canadian bank statement parsers."""
+from datetime import datetime
+
+import pytest
+
+from app.parsers import parse_canadian_date_formats
+
+@pytest.mark.parametrize("date_str, expected", [
+    ("15/01/2025", datetime(2025, 1, 15)),
+    ("15-01-2025", datetime(2025, 1, 15)),
+    ("2025/01/15", datetime(2025, 1, 15)),
+    ("2025-01-15", datetime(2025, 1, 15)),
+    ("Jan 15 2025", datetime(2025, 1, 15)),
+    ("JAN 5 2025", datetime(2025, 1, 5)),
+    ("January 15, 2025", datetime(2025, 1, 15)),
+    ("september 1, 2024", datetime(2024, 9, 1)),
+    ("29/02/2024", datetime(2024, 2, 29)),
+])
+def test_parse_canadian_date_formats(date_str, expected):
+    assert parse_canadian_date_formats(date_str) == expected
+
+@pytest.mark.parametrize("date_str", [
+    "31/02/2025",         # well-formed, not a real date
+    "29/02/2025",
+    "2025/01-15",         # mixed separators
+    "15/13/2025",
+    "Jan 32 2025",
+    "Sept 15 2025",
+    "January 15 2025",    # full month names need the comma
+    "15/01/2025 extra",
+    "not a date",
+    "",
+])
+def test_parse_canadian_date_formats_invalid(date_str):
+    with pytest.raises(ValueError, match="Unable to parse date"):
+        parse_canadian_date_formats(date_str)
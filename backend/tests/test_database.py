@@ -0,0 +1,13 @@
+"""Tests for the database helpers."""
+from sqlalchemy import text
+
+from app.database import count_queries, engine
+
+def test_count_queries_records_statements_inside_block():
+    with engine.connect() as conn:
+        with count_queries() as statements:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        conn.execute(text("SELECT 3"))
+    
+    assert statements == ["SELECT 1", "SELECT 2"]
@@ -0,0 +1,85 @@
+"""Tests for the statement parsing helpers in routers/files.py."""
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.routers.files import (
+    AMOUNT_STRIP_TABLE, parse_amount, parse_csv_transactions, parse_generic_date, pd,
+)
+
+@pytest.mark.parametrize("date_str, expected", [
+    # '/' with a 4-digit year: day-first, then month-first
+    ("15/01/2025", datetime(2025, 1, 15)),
+    ("01/02/2025", datetime(2025, 2, 1)),
+    ("01/13/2025", datetime(2025, 1, 13)),
+    # '-' with a 4-digit year: month-first, then day-first
+    ("01-02-2025", datetime(2025, 1, 2)),
+    ("13-01-2025", datetime(2025, 1, 13)),
+    # 2-digit years are month-first
+    ("01/02/24", datetime(2024, 1, 2)),
+    ("12-31-99", datetime(1999, 12, 31)),
+    ("29/02/2024", datetime(2024, 2, 29)),
+])
+def test_parse_generic_date(date_str, expected):
+    assert parse_generic_date(date_str) == expected
+
+@pytest.mark.parametrize("year, expected", [
+    ("68", 2068),
+    ("69", 1969),
+    ("00", 2000),
+    ("99", 1999),
+])
+def test_parse_generic_date_two_digit_year_pivot(year, expected):
+    # Same pivot as strptime's %y
+    assert parse_generic_date(f"01/15/{year}") == datetime(expected, 1, 15)
+    assert parse_generic_date(f"01/15/{year}") == datetime.strptime(f"01/15/{year}", "%m/%d/%y")
+
+@pytest.mark.parametrize("date_str", [
+    "31/31/2025",   # no valid month either way
+    "29/02/2025",   # not a leap year
+    "02/30/24",     # 2-digit years never fall back to day-first
+    "13/01/24",
+    "01/02-2025",   # mixed separators
+    "01/02/202",    # 3-digit year
+    "01/01/0000",
+])
+def test_parse_generic_date_invalid(date_str):
+    assert parse_generic_date(date_str) is None
+
+@pytest.mark.parametrize("value, expected", [
+    ("12.50", Decimal("12.50")),
+    ("-12.50", Decimal("-12.50")),
+    ("$1,234.56", Decimal("1234.56")),
+    ("(12.50)", Decimal("-12.50")),
+    (" ($1,000.00) ", Decimal("-1000.00")),
+    (3.1, Decimal("3.1")),
+    (42, Decimal("42.0")),
+])
+def test_parse_amount(value, expected):
+    assert parse_amount(value) == expected
+
+@pytest.mark.parametrize("value", ["", "abc", "(12.50", "12.50)", "()"])
+def test_parse_amount_invalid(value):
+    with pytest.raises(ValueError):
+        parse_amount(value)
+
+def test_amount_strip_table_keeps_parentheses():
+    assert "($1,234.56)".translate(AMOUNT_STRIP_TABLE) == "(1234.56)"
+
+@pytest.mark.skipif(pd is None, reason="pandas not installed")
+@pytest.mark.parametrize("encoding, description", [
+    ("utf-8", "Café Montréal"),
+    ("latin-1", "Café Montréal"),
+    # 0x80 and 0x92 are only defined in cp1252
+    ("cp1252", "Tim’s Café €5 off"),
+])
+def test_parse_csv_transactions_encodings(tmp_path, encoding, description):
+    csv_path = tmp_path / "statement.csv"
+    csv_path.write_bytes(
+        f"Date,Description,Amount\n15/01/2025,{description},-12.50\n".encode(encoding)
+    )
+    transactions = parse_csv_transactions(str(csv_path))
+    assert len(transactions) == 1
+    assert transactions[0]["description"] == description
+    assert transactions[0]["amount"] == Decimal("-12.50")